@@ -3,21 +3,83 @@ Auto-remediation module for SpecSync.
 Automatically creates tasks to fix detected drift.
 """
 
+from functools import cached_property, lru_cache
+from itertools import groupby
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
 from datetime import datetime
 
 
+# Order in which task types are listed in the tasks file
+TYPE_RANK = {'spec': 0, 'test': 1, 'doc': 2, 'code': 3}
+
+# Section titles of the task types in the tasks file
+TYPE_NAMES = {
+    'spec': '📋 Specification Updates',
+    'test': '🧪 Test Coverage',
+    'doc': '📚 Documentation',
+    'code': '💻 Code Fixes'
+}
+
+# Markdown templates for the tasks file
+_HEADER_TEMPLATE = """# Remediation Tasks
+
+**Generated:** {generated}  
+**Feature:** {feature}  
+**Total Tasks:** {total}
+
+These tasks were automatically generated by SpecSync to fix detected drift.
+
+---
+
+## Tasks by Priority
+
+"""
+
+_SECTION_TEMPLATE = "\n### {title}\n\n"
+
+_TASK_TEMPLATE = (
+    "- [ ] **{task.description}**\n"
+    "  - **File:** `{task.file}`\n"
+    "  - **Priority:** {task.priority}/10\n"
+    "  - **Details:** {task.details}\n"
+    "  - **Created:** {task.created_at}\n"
+    "\n"
+)
+
+_FOOTER = """
+---
+
+## How to Use These Tasks
+
+1. **Review each task** - Understand what needs to be fixed
+2. **Implement the changes** - Update specs, add tests, write docs
+3. **Check off completed tasks** - Mark with `[x]` when done
+4. **Re-run validation** - Verify all drift is resolved
+5. **Commit together** - Stage all changes and commit
+
+---
+
+## Auto-Generated by SpecSync
+
+This file was automatically created by SpecSync's auto-remediation engine.
+You can edit or delete tasks as needed.
+"""
+
+
 class RemediationTask:
     """Represents a task to fix drift."""
     
-    def __init__(self, task_type: str, description: str, file: str, details: str, priority: int = 5):
+    __slots__ = ('task_type', 'description', 'file', 'details', 'priority', 'created_at')
+    
+    def __init__(self, task_type: str, description: str, file: str, details: str, priority: int = 5,
+                 created_at: Optional[str] = None):
         self.task_type = task_type  # 'spec', 'test', 'doc', 'code'
         self.description = description
         self.file = file
         self.details = details
         self.priority = priority
-        self.created_at = datetime.now().isoformat()
+        self.created_at = created_at if created_at is not None else datetime.now().isoformat()
     
     def to_dict(self):
         return {
@@ -30,231 +92,213 @@ class RemediationTask:
         }
 
 
+def _add_spec_task(description: str, file: str, created_at: Optional[str]) -> RemediationTask:
+    return RemediationTask(
+        task_type='spec',
+        description=f"Add missing endpoint/function to spec",
+        file='.kiro/specs/app.yaml',
+        details=f"Add definition for {description} found in {file}",
+        priority=9,
+        created_at=created_at
+    )
+
+
+def _remove_spec_task(description: str, file: str, created_at: Optional[str]) -> RemediationTask:
+    return RemediationTask(
+        task_type='spec',
+        description=f"Remove deleted functionality from spec",
+        file='.kiro/specs/app.yaml',
+        details=f"Remove definition for {description}",
+        priority=8,
+        created_at=created_at
+    )
+
+
+def _missing_tests_task(description: str, file: str, created_at: Optional[str]) -> RemediationTask:
+    # Extract the code file from description
+    _, sep, tail = description.rpartition('for ')
+    code_file = tail if sep else file
+    test_file = code_file.replace('backend/', 'tests/unit/test_')
+    
+    return RemediationTask(
+        task_type='test',
+        description=f"Create tests for {code_file}",
+        file=test_file,
+        details=f"Add unit tests covering all functions in {code_file}",
+        priority=7,
+        created_at=created_at
+    )
+
+
+def _coverage_task(description: str, file: str, created_at: Optional[str]) -> RemediationTask:
+    return RemediationTask(
+        task_type='test',
+        description=f"Improve test coverage",
+        file=file,
+        details=description,
+        priority=6,
+        created_at=created_at
+    )
+
+
+def _missing_docs_task(description: str, file: str, created_at: Optional[str]) -> RemediationTask:
+    return RemediationTask(
+        task_type='doc',
+        description=f"Document new API endpoint",
+        file=file if file else 'docs/api/users.md',
+        details=description,
+        priority=5,
+        created_at=created_at
+    )
+
+
+def _outdated_docs_task(description: str, file: str, created_at: Optional[str]) -> RemediationTask:
+    return RemediationTask(
+        task_type='doc',
+        description=f"Update outdated documentation",
+        file=file,
+        details=description,
+        priority=6,
+        created_at=created_at
+    )
+
+
+# Task factories per report, as (issue type marker, factory) pairs in order
+# of precedence. Issue types such as 'endpoint_removed' or 'outdated_docs'
+# only contain a marker, so the first marker found in the type selects the
+# factory.
+_DRIFT_TASK_FACTORIES = (
+    ('new_endpoint', _add_spec_task),
+    ('new_function', _add_spec_task),
+    ('removed', _remove_spec_task),
+)
+_TEST_TASK_FACTORIES = (
+    ('missing_tests', _missing_tests_task),
+    ('insufficient_coverage', _coverage_task),
+)
+_DOC_TASK_FACTORIES = (
+    ('missing_docs', _missing_docs_task),
+    ('outdated', _outdated_docs_task),
+)
+
+
+@lru_cache(maxsize=256)
+def _task_factory(factories: tuple, issue_type: str) -> Optional[Callable]:
+    """Resolve the task factory for an issue type (cached per distinct type)."""
+    for marker, factory in factories:
+        if marker in issue_type:
+            return factory
+    return None
+
+
+def _build_tasks(issues: List[Any], factories: tuple, default_file: str,
+                 created_at: Optional[str]) -> List[RemediationTask]:
+    """Build a task for every issue whose type has a factory."""
+    return [
+        factory(issue.get('description', ''), issue.get('file', default_file), created_at)
+        for issue in issues
+        if isinstance(issue, dict)
+        for factory in (_task_factory(factories, issue.get('type', 'unknown')),)
+        if factory is not None
+    ]
+
+
 class AutoRemediationEngine:
     """Generates remediation tasks from validation results."""
     
     def __init__(self, feature_name: str = "app"):
         self.feature_name = feature_name
-        self.tasks_file = Path(f".kiro/specs/{feature_name}/remediation-tasks.md")
+    
+    @cached_property
+    def tasks_file(self) -> Path:
+        """Path of the remediation tasks file, built on first use."""
+        return Path(f".kiro/specs/{self.feature_name}/remediation-tasks.md")
     
     def generate_tasks_from_validation(self, validation_result: Dict[str, Any]) -> List[RemediationTask]:
         """Generate remediation tasks from validation results."""
         tasks = []
         
+        # Tasks generated from one validation run share a creation time
+        created_at = datetime.now().isoformat()
+        
         # Extract reports
         drift_report = validation_result.get('drift_report')
         test_report = validation_result.get('test_report')
         doc_report = validation_result.get('doc_report')
         
         # Generate tasks from drift issues
-        if drift_report:
-            tasks.extend(self._generate_drift_tasks(drift_report))
+        if drift_report and not drift_report.get('aligned', True):
+            tasks.extend(self._generate_drift_tasks(drift_report, created_at))
         
         # Generate tasks from test coverage issues
-        if test_report:
-            tasks.extend(self._generate_test_tasks(test_report))
+        if test_report and test_report.get('has_issues', False):
+            tasks.extend(self._generate_test_tasks(test_report, created_at))
         
         # Generate tasks from documentation issues
-        if doc_report:
-            tasks.extend(self._generate_doc_tasks(doc_report))
+        if doc_report and doc_report.get('has_issues', False):
+            tasks.extend(self._generate_doc_tasks(doc_report, created_at))
         
         return tasks
     
-    def _generate_drift_tasks(self, drift_report: Dict[str, Any]) -> List[RemediationTask]:
-        """Generate tasks from drift issues."""
-        tasks = []
-        
-        aligned = drift_report.get('aligned', True)
-        if aligned:
-            return tasks
-        
-        issues = drift_report.get('issues', [])
-        
-        for issue in issues:
-            if isinstance(issue, dict):
-                issue_type = issue.get('type', 'unknown')
-                file = issue.get('file', 'unknown')
-                description = issue.get('description', '')
-                
-                if 'new_endpoint' in issue_type or 'new_function' in issue_type:
-                    task = RemediationTask(
-                        task_type='spec',
-                        description=f"Add missing endpoint/function to spec",
-                        file='.kiro/specs/app.yaml',
-                        details=f"Add definition for {description} found in {file}",
-                        priority=9
-                    )
-                    tasks.append(task)
-                
-                elif 'removed' in issue_type:
-                    task = RemediationTask(
-                        task_type='spec',
-                        description=f"Remove deleted functionality from spec",
-                        file='.kiro/specs/app.yaml',
-                        details=f"Remove definition for {description}",
-                        priority=8
-                    )
-                    tasks.append(task)
-        
-        return tasks
+    def _generate_drift_tasks(self, drift_report: Dict[str, Any],
+                              created_at: Optional[str] = None) -> List[RemediationTask]:
+        """Generate tasks from drift issues (callers check that the report isn't aligned)."""
+        return _build_tasks(drift_report.get('issues', []), _DRIFT_TASK_FACTORIES, 'unknown', created_at)
     
-    def _generate_test_tasks(self, test_report: Dict[str, Any]) -> List[RemediationTask]:
-        """Generate tasks from test coverage issues."""
-        tasks = []
-        
-        has_issues = test_report.get('has_issues', False)
-        if not has_issues:
-            return tasks
-        
-        issues = test_report.get('issues', [])
-        
-        for issue in issues:
-            if isinstance(issue, dict):
-                issue_type = issue.get('type', 'unknown')
-                description = issue.get('description', '')
-                file = issue.get('file', '')
-                
-                if 'missing_tests' in issue_type:
-                    # Extract the code file from description
-                    code_file = description.split('for ')[-1] if 'for ' in description else file
-                    test_file = code_file.replace('backend/', 'tests/unit/test_').replace('.py', '.py')
-                    
-                    task = RemediationTask(
-                        task_type='test',
-                        description=f"Create tests for {code_file}",
-                        file=test_file,
-                        details=f"Add unit tests covering all functions in {code_file}",
-                        priority=7
-                    )
-                    tasks.append(task)
-                
-                elif 'insufficient_coverage' in issue_type:
-                    task = RemediationTask(
-                        task_type='test',
-                        description=f"Improve test coverage",
-                        file=file,
-                        details=description,
-                        priority=6
-                    )
-                    tasks.append(task)
-        
-        return tasks
+    def _generate_test_tasks(self, test_report: Dict[str, Any],
+                             created_at: Optional[str] = None) -> List[RemediationTask]:
+        """Generate tasks from test coverage issues (callers check that the report has issues)."""
+        return _build_tasks(test_report.get('issues', []), _TEST_TASK_FACTORIES, '', created_at)
     
-    def _generate_doc_tasks(self, doc_report: Dict[str, Any]) -> List[RemediationTask]:
-        """Generate tasks from documentation issues."""
-        tasks = []
-        
-        has_issues = doc_report.get('has_issues', False)
-        if not has_issues:
-            return tasks
-        
-        issues = doc_report.get('issues', [])
-        
-        for issue in issues:
-            if isinstance(issue, dict):
-                issue_type = issue.get('type', 'unknown')
-                description = issue.get('description', '')
-                file = issue.get('file', 'docs/api/')
-                
-                if 'missing_docs' in issue_type:
-                    task = RemediationTask(
-                        task_type='doc',
-                        description=f"Document new API endpoint",
-                        file=file if file else 'docs/api/users.md',
-                        details=description,
-                        priority=5
-                    )
-                    tasks.append(task)
-                
-                elif 'outdated' in issue_type:
-                    task = RemediationTask(
-                        task_type='doc',
-                        description=f"Update outdated documentation",
-                        file=file,
-                        details=description,
-                        priority=6
-                    )
-                    tasks.append(task)
-        
-        return tasks
+    def _generate_doc_tasks(self, doc_report: Dict[str, Any],
+                            created_at: Optional[str] = None) -> List[RemediationTask]:
+        """Generate tasks from documentation issues (callers check that the report has issues)."""
+        return _build_tasks(doc_report.get('issues', []), _DOC_TASK_FACTORIES, 'docs/api/', created_at)
     
     def write_tasks_to_file(self, tasks: List[RemediationTask]) -> str:
         """Write remediation tasks to a markdown file."""
         if not tasks:
             return "No remediation tasks needed."
         
+        return self._write_tasks(tasks)[0]
+    
+    def _write_tasks(self, tasks: List[RemediationTask]) -> Tuple[str, Dict[str, int]]:
+        """Write remediation tasks to the tasks file and count the tasks written per type."""
         # Ensure directory exists
         self.tasks_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Sort tasks by priority (highest first)
-        sorted_tasks = sorted(tasks, key=lambda t: t.priority, reverse=True)
-        
-        # Generate markdown content
-        content = f"""# Remediation Tasks
-
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
-**Feature:** {self.feature_name}  
-**Total Tasks:** {len(tasks)}
-
-These tasks were automatically generated by SpecSync to fix detected drift.
-
----
-
-## Tasks by Priority
-
-"""
-        
-        # Group by type
-        by_type = {}
-        for task in sorted_tasks:
-            if task.task_type not in by_type:
-                by_type[task.task_type] = []
-            by_type[task.task_type].append(task)
+        # Order tasks by type, then by priority (highest first)
+        sorted_tasks = sorted(
+            (t for t in tasks if t.task_type in TYPE_RANK),
+            key=lambda t: (TYPE_RANK[t.task_type], -t.priority)
+        )
         
-        # Write tasks by type
-        type_names = {
-            'spec': '📋 Specification Updates',
-            'test': '🧪 Test Coverage',
-            'doc': '📚 Documentation',
-            'code': '💻 Code Fixes'
-        }
+        # Stream the markdown straight into the file
+        counts = {}
+        with open(self.tasks_file, 'w', encoding='utf-8', newline='\n') as f:
+            f.writelines(self._render_tasks(sorted_tasks, len(tasks), counts))
         
-        for task_type in ['spec', 'test', 'doc', 'code']:
-            if task_type in by_type:
-                content += f"\n### {type_names.get(task_type, task_type.title())}\n\n"
-                
-                for i, task in enumerate(by_type[task_type], 1):
-                    content += f"- [ ] **{task.description}**\n"
-                    content += f"  - **File:** `{task.file}`\n"
-                    content += f"  - **Priority:** {task.priority}/10\n"
-                    content += f"  - **Details:** {task.details}\n"
-                    content += f"  - **Created:** {task.created_at}\n"
-                    content += "\n"
-        
-        content += """
----
-
-## How to Use These Tasks
-
-1. **Review each task** - Understand what needs to be fixed
-2. **Implement the changes** - Update specs, add tests, write docs
-3. **Check off completed tasks** - Mark with `[x]` when done
-4. **Re-run validation** - Verify all drift is resolved
-5. **Commit together** - Stage all changes and commit
-
----
-
-## Auto-Generated by SpecSync
-
-This file was automatically created by SpecSync's auto-remediation engine.
-You can edit or delete tasks as needed.
-"""
+        return str(self.tasks_file), counts
+    
+    def _render_tasks(self, sorted_tasks: List[RemediationTask], total: int,
+                      counts: Dict[str, int]) -> Iterator[str]:
+        """Yield the markdown of the tasks file block by block, counting the tasks rendered per type."""
+        yield _HEADER_TEMPLATE.format(
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            feature=self.feature_name,
+            total=total
+        )
         
-        # Write to file
-        with open(self.tasks_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Tasks by type
+        for task_type, group in groupby(sorted_tasks, key=lambda t: t.task_type):
+            yield _SECTION_TEMPLATE.format(title=TYPE_NAMES.get(task_type, task_type.title()))
+            
+            counts[task_type] = 0
+            for task in group:
+                counts[task_type] += 1
+                yield _TASK_TEMPLATE.format(task=task)
         
-        return str(self.tasks_file)
+        yield _FOOTER
     
     def create_remediation_tasks(self, validation_result: Dict[str, Any]) -> str:
         """Main entry point: generate and write remediation tasks."""
@@ -263,7 +307,7 @@ You can edit or delete tasks as needed.
         if not tasks:
             return "✅ No remediation tasks needed - all validations passed!"
         
-        file_path = self.write_tasks_to_file(tasks)
+        file_path, counts = self._write_tasks(tasks)
         
         return f"""
 🔧 Auto-Remediation Tasks Generated!
@@ -272,10 +316,10 @@ You can edit or delete tasks as needed.
 📊 Total tasks: {len(tasks)}
 
 Task breakdown:
-  - Spec updates: {len([t for t in tasks if t.task_type == 'spec'])}
-  - Test additions: {len([t for t in tasks if t.task_type == 'test'])}
-  - Documentation: {len([t for t in tasks if t.task_type == 'doc'])}
-  - Code fixes: {len([t for t in tasks if t.task_type == 'code'])}
+  - Spec updates: {counts.get('spec', 0)}
+  - Test additions: {counts.get('test', 0)}
+  - Documentation: {counts.get('doc', 0)}
+  - Code fixes: {counts.get('code', 0)}
 
 Open the tasks file to see detailed remediation steps!
 """
@@ -4,9 +4,58 @@ Documentation validation module for SpecSync.
 This module provides functionality to validate documentation alignment with
 code changes and specifications.
 """
+import os
 import re
+import threading
+from concurrent.futures import CancelledError
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Any, Tuple
+
+
+# Endpoint headers like "## GET /users" or "## POST /users/{id}"
+_ENDPOINT_HEADER_RE = re.compile(r'^##\s+(GET|POST|PUT|DELETE|PATCH)\s+(/[^\s]*)')
+
+# Code references: fenced code blocks, function calls inside them, file
+# paths in inline code and endpoint mentions anywhere in the text
+_CODE_BLOCK_RE = re.compile(r'```[\w]*\n(.*?)```', re.DOTALL)
+_FUNCTION_CALL_RE = re.compile(r'\b([a-z_][a-z0-9_]*)\s*\(', re.IGNORECASE)
+_FILE_REF_RE = re.compile(r'`([a-zA-Z0-9_/.-]+\.(py|yaml|md|json))`')
+_ENDPOINT_REF_RE = re.compile(r'`?(GET|POST|PUT|DELETE|PATCH)\s+(/[^\s`]*)`?')
+
+# Route decorators are attribute calls like "@router.get(...)"; the method
+# name is matched case-insensitively, as CodeParser upper-cases it
+_ROUTE_ATTRIBUTE_RE = re.compile(rb'\.[\s\\]*(?:get|post|put|delete|patch)\b', re.IGNORECASE)
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested dicts and lists into read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=256)
+def _analyze_file_version(analyze, path: str, abs_path: str, mtime_ns: int, size: int) -> Any:
+    """Run an analysis once per file version; abs_path, mtime_ns and size only key the cache."""
+    return _freeze(analyze(path))
+
+
+def _cached_analysis(path: str, analyze) -> Any:
+    """
+    Return the read-only result of analyze(path), reused while the file is unchanged.
+    
+    Results are shared between callers, so they are frozen rather than copied.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        # Let the analysis report the missing file the way it always has
+        return _freeze(analyze(path))
+    return _analyze_file_version(analyze, path, os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
 
 
 class MarkdownParser:
@@ -22,6 +71,9 @@ class MarkdownParser:
         self.doc_path = Path(doc_path)
         self.content: Optional[str] = None
         self.sections: Dict[str, str] = {}
+        self._endpoints: Optional[List[Dict[str, Any]]] = None
+        self._code_refs: Optional[List[str]] = None
+        self._content_lower: Optional[str] = None
     
     def parse(self) -> str:
         """
@@ -33,19 +85,38 @@ class MarkdownParser:
         Raises:
             FileNotFoundError: If documentation file doesn't exist
         """
-        if not self.doc_path.exists():
-            raise FileNotFoundError(f"Documentation file not found: {self.doc_path}")
-        
-        with open(self.doc_path, 'r', encoding='utf-8') as f:
-            self.content = f.read()
-        
-        # Parse sections
-        self._parse_sections()
+        # Read the whole file with a single read on a raw descriptor rather
+        # than through the buffered text IO stack
+        try:
+            fd = os.open(self.doc_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Documentation file not found: {self.doc_path}") from None
+        try:
+            size = os.fstat(fd).st_size
+            data = os.read(fd, size)
+            while len(data) < size:
+                chunk = os.read(fd, size - len(data))
+                if not chunk:
+                    break
+                data += chunk
+        finally:
+            os.close(fd)
+        
+        # Decode with the same universal newline handling as text mode
+        content = data.decode('utf-8')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        self.content = content
+        self._code_refs = None
+        self._content_lower = None
+        
+        # Parse sections and endpoints
+        self._tokenize()
         
         return self.content
     
-    def _parse_sections(self):
-        """Parse markdown into sections based on headers."""
+    def _tokenize(self):
+        """Split the markdown into sections and endpoint descriptions in one pass over its lines."""
         if self.content is None:
             return
         
@@ -53,8 +124,15 @@ class MarkdownParser:
         lines = self.content.split('\n')
         current_section = None
         current_content = []
+        api_endpoints = []
         
-        for line in lines:
+        for i, line in enumerate(lines):
+            # Endpoint headers look like "## GET /users"
+            if line.startswith('##'):
+                match = _ENDPOINT_HEADER_RE.match(line)
+                if match:
+                    api_endpoints.append(self._describe_endpoint(match, lines, i))
+            
             # Check for headers
             if line.startswith('## '):
                 # Save previous section
@@ -76,6 +154,27 @@ class MarkdownParser:
         # Save last section
         if current_section:
             self.sections[current_section] = '\n'.join(current_content)
+        
+        self._endpoints = api_endpoints
+    
+    @staticmethod
+    def _describe_endpoint(match: re.Match, lines: List[str], i: int) -> Dict[str, Any]:
+        """Build the description of the endpoint whose header is on line i."""
+        # Extract description from following lines
+        description = ""
+        for j in range(i + 1, min(i + 10, len(lines))):
+            if lines[j].startswith('##'):
+                break
+            if lines[j].strip() and not lines[j].startswith('#'):
+                description = lines[j].strip()
+                break
+        
+        return {
+            'method': match.group(1),
+            'path': match.group(2),
+            'description': description,
+            'line': i + 1
+        }
     
     def extract_api_descriptions(self) -> List[Dict[str, Any]]:
         """
@@ -87,35 +186,11 @@ class MarkdownParser:
         if self.content is None:
             self.parse()
         
-        api_endpoints = []
-        
-        # Pattern to match endpoint headers like "GET /users" or "POST /users/{id}"
-        endpoint_pattern = r'^##\s+(GET|POST|PUT|DELETE|PATCH)\s+(/[^\s]*)'
-        
-        lines = self.content.split('\n')
-        for i, line in enumerate(lines):
-            match = re.match(endpoint_pattern, line)
-            if match:
-                method = match.group(1)
-                path = match.group(2)
-                
-                # Extract description from following lines
-                description = ""
-                for j in range(i + 1, min(i + 10, len(lines))):
-                    if lines[j].startswith('##'):
-                        break
-                    if lines[j].strip() and not lines[j].startswith('#'):
-                        description = lines[j].strip()
-                        break
-                
-                api_endpoints.append({
-                    'method': method,
-                    'path': path,
-                    'description': description,
-                    'line': i + 1
-                })
+        # Endpoints are collected by the same pass that builds the sections
+        if self._endpoints is None:
+            self._tokenize()
         
-        return api_endpoints
+        return list(self._endpoints)
     
     def get_sections(self) -> Dict[str, str]:
         """
@@ -145,8 +220,11 @@ class MarkdownParser:
         
         if case_sensitive:
             return text in self.content
-        else:
-            return text.lower() in self.content.lower()
+        
+        # Lowercase the document once per parse rather than on every search
+        if self._content_lower is None:
+            self._content_lower = self.content.lower()
+        return text.lower() in self._content_lower
     
     def extract_code_references(self) -> List[str]:
         """
@@ -163,29 +241,27 @@ class MarkdownParser:
         if self.content is None:
             self.parse()
         
+        # References are extracted once per parse of the file
+        if self._code_refs is not None:
+            return list(self._code_refs)
+        
         references = []
         
         # Extract code blocks
-        code_block_pattern = r'```[\w]*\n(.*?)```'
-        code_blocks = re.findall(code_block_pattern, self.content, re.DOTALL)
-        
-        for block in code_blocks:
+        for block in _CODE_BLOCK_RE.findall(self.content):
             # Extract function-like patterns
-            function_pattern = r'\b([a-z_][a-z0-9_]*)\s*\('
-            functions = re.findall(function_pattern, block, re.IGNORECASE)
-            references.extend(functions)
+            references.extend(_FUNCTION_CALL_RE.findall(block))
         
         # Extract file paths
-        file_pattern = r'`([a-zA-Z0-9_/.-]+\.(py|yaml|md|json))`'
-        files = re.findall(file_pattern, self.content)
+        files = _FILE_REF_RE.findall(self.content)
         references.extend([f[0] for f in files])
         
         # Extract API endpoints
-        endpoint_pattern = r'`?(GET|POST|PUT|DELETE|PATCH)\s+(/[^\s`]*)`?'
-        endpoints = re.findall(endpoint_pattern, self.content)
+        endpoints = _ENDPOINT_REF_RE.findall(self.content)
         references.extend([f"{method} {path}" for method, path in endpoints])
         
-        return list(set(references))  # Remove duplicates
+        self._code_refs = list(set(references))  # Remove duplicates
+        return list(self._code_refs)
 
 
 class DocumentationMapper:
@@ -200,6 +276,45 @@ class DocumentationMapper:
         """
         self.project_root = Path(project_root)
         self.docs_dir = self.project_root / "docs"
+        self._api_dir = str(self.docs_dir / "api")
+        self._doc_files: Optional[Tuple[str, ...]] = None
+        self._code_to_docs: Dict[str, Tuple[str, ...]] = {}
+    
+    def _scan_docs(self) -> Tuple[str, ...]:
+        """
+        Find the markdown files under the docs directory, walking it once per mapper.
+        
+        Returns:
+            Paths of all markdown files (empty if the docs directory doesn't exist)
+        """
+        if self._doc_files is None:
+            doc_files: List[str] = []
+            if self.docs_dir.exists():
+                self._walk_docs(str(self.docs_dir), doc_files)
+            self._doc_files = tuple(doc_files)
+        return self._doc_files
+    
+    @classmethod
+    def _walk_docs(cls, directory: str, doc_files: List[str]) -> None:
+        """
+        Collect markdown files below a directory with os.scandir.
+        
+        Files are listed before subdirectories are visited, the same order
+        Path.rglob("*.md") produces, without building a Path per entry.
+        Symlinked directories are not descended into, as with rglob.
+        """
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith('.md'):
+                        doc_files.append(entry.path)
+        except OSError:
+            return
+        for subdir in subdirs:
+            cls._walk_docs(subdir, doc_files)
     
     def map_code_to_docs(self, code_file: str) -> List[str]:
         """
@@ -216,6 +331,15 @@ class DocumentationMapper:
         Returns:
             List of documentation file paths that should document this code
         """
+        # Each code file is mapped once per mapper, like the docs scan
+        doc_files = self._code_to_docs.get(code_file)
+        if doc_files is None:
+            doc_files = tuple(self._map_code_file(code_file))
+            self._code_to_docs[code_file] = doc_files
+        return list(doc_files)
+    
+    def _map_code_file(self, code_file: str) -> List[str]:
+        """Apply the code-to-docs conventions to a single code file."""
         code_path = Path(code_file)
         doc_files = []
         
@@ -241,10 +365,7 @@ class DocumentationMapper:
         # Map models to API docs (they might be referenced in multiple docs)
         elif code_path.match('backend/models.py'):
             # Check all API docs
-            api_dir = self.docs_dir / "api"
-            if api_dir.exists():
-                for doc_file in api_dir.glob("*.md"):
-                    doc_files.append(str(doc_file))
+            doc_files.extend(self.get_public_api_files())
         
         return doc_files
     
@@ -281,16 +402,7 @@ class DocumentationMapper:
         Returns:
             List of all documentation file paths
         """
-        doc_files = []
-        
-        if not self.docs_dir.exists():
-            return doc_files
-        
-        # Find all markdown files recursively
-        for doc_file in self.docs_dir.rglob("*.md"):
-            doc_files.append(str(doc_file))
-        
-        return doc_files
+        return list(self._scan_docs())
     
     def get_public_api_files(self) -> List[str]:
         """
@@ -299,11 +411,8 @@ class DocumentationMapper:
         Returns:
             List of API documentation file paths
         """
-        api_dir = self.docs_dir / "api"
-        if not api_dir.exists():
-            return []
-        
-        return [str(f) for f in api_dir.glob("*.md")]
+        api_dir = self._api_dir
+        return [f for f in self._scan_docs() if os.path.dirname(f) == api_dir]
 
 
 class DocumentationAnalyzer:
@@ -329,7 +438,7 @@ class DocumentationAnalyzer:
         else:
             self.spec_parser = None
     
-    def analyze_doc_file(self, doc_file: str) -> Dict[str, Any]:
+    def analyze_doc_file(self, doc_file: str) -> Mapping[str, Any]:
         """
         Analyze a documentation file and extract information.
         
@@ -337,8 +446,13 @@ class DocumentationAnalyzer:
             doc_file: Path to the documentation file
             
         Returns:
-            Dictionary containing analysis results
+            Read-only mapping containing analysis results
         """
+        return _cached_analysis(doc_file, self._analyze_doc_file)
+    
+    @staticmethod
+    def _analyze_doc_file(doc_file: str) -> Dict[str, Any]:
+        """Parse a documentation file without consulting the cache."""
         parser = MarkdownParser(doc_file)
         parser.parse()
         
@@ -417,7 +531,7 @@ class DocumentationAnalyzer:
             'missing_docs': [f for f in doc_files if f not in existing_docs]
         }
     
-    def extract_endpoints_from_code(self, code_file: str) -> List[Dict[str, Any]]:
+    def extract_endpoints_from_code(self, code_file: str) -> Sequence[Mapping[str, Any]]:
         """
         Extract API endpoints from a code file.
         
@@ -425,8 +539,23 @@ class DocumentationAnalyzer:
             code_file: Path to the code file
             
         Returns:
-            List of endpoints found in the code
+            Read-only sequence of endpoints found in the code
         """
+        return _cached_analysis(code_file, self._extract_endpoints)
+    
+    @staticmethod
+    def _extract_endpoints(code_file: str) -> List[Dict[str, Any]]:
+        """Parse a code file for endpoints without consulting the cache."""
+        # Most code files declare no routes; skip the AST parse when the
+        # source has no decorators or no route-like attribute at all
+        try:
+            with open(code_file, 'rb') as f:
+                source = f.read()
+        except OSError:
+            source = None
+        if source is not None and (b'@' not in source or not _ROUTE_ATTRIBUTE_RE.search(source)):
+            return []
+        
         from backend.drift_detector import CodeParser
         
         parser = CodeParser(code_file)
@@ -711,15 +840,20 @@ class DocumentationAlignmentDetector:
         
         return issues
     
-    def generate_documentation_report(self, code_files: List[str]) -> DocumentationReport:
+    def generate_documentation_report(self, code_files: List[str],
+                                      cancel_event: Optional[threading.Event] = None) -> DocumentationReport:
         """
         Generate a comprehensive documentation alignment report.
         
         Args:
             code_files: List of code files to check
+            cancel_event: Event that, once set, stops the report before the next file
             
         Returns:
             DocumentationReport with all detected issues
+            
+        Raises:
+            CancelledError: If cancel_event is set before all files are checked
         """
         report = DocumentationReport()
         
@@ -728,6 +862,9 @@ class DocumentationAlignmentDetector:
         files_with_issues = 0
         
         for code_file in code_files:
+            if cancel_event is not None and cancel_event.is_set():
+                raise CancelledError("Documentation validation cancelled")
+            
             files_checked += 1
             file_issues = []
             
@@ -763,7 +900,8 @@ class DocumentationAlignmentDetector:
         
         return report
     
-    def validate_staged_changes(self, staged_files: List[str]) -> DocumentationReport:
+    def validate_staged_changes(self, staged_files: List[str],
+                                cancel_event: Optional[threading.Event] = None) -> DocumentationReport:
         """
         Validate documentation alignment for staged changes.
         
@@ -771,9 +909,13 @@ class DocumentationAlignmentDetector:
         
         Args:
             staged_files: List of staged file paths
+            cancel_event: Event that, once set, stops validation before the next file
             
         Returns:
             DocumentationReport with validation results
+            
+        Raises:
+            CancelledError: If cancel_event is set before all files are checked
         """
         # Filter to only Python files in backend that might have public APIs
         code_files = [
@@ -792,7 +934,7 @@ class DocumentationAlignmentDetector:
             return report
         
         # Generate comprehensive report
-        report = self.generate_documentation_report(code_files)
+        report = self.generate_documentation_report(code_files, cancel_event)
         
         # Add message to summary
         if report.has_issues():
@@ -6,6 +6,8 @@ code implementations, and other artifacts.
 """
 import ast
 import re
+import threading
+from concurrent.futures import CancelledError
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import yaml
@@ -634,15 +636,20 @@ class MultiFileValidator:
         # No spec mapping for this file
         return None
     
-    def validate_multiple_files(self, file_paths: List[str]) -> Dict[str, Any]:
+    def validate_multiple_files(self, file_paths: List[str],
+                                cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
         """
         Validate multiple files and aggregate drift reports.
         
         Args:
             file_paths: List of file paths to validate
+            cancel_event: Event that, once set, stops validation before the next file
             
         Returns:
             Aggregated validation result with per-file reports
+            
+        Raises:
+            CancelledError: If cancel_event is set before all files are validated
         """
         aggregated_report = {
             'aligned': True,
@@ -654,6 +661,9 @@ class MultiFileValidator:
         }
         
         for file_path in file_paths:
+            if cancel_event is not None and cancel_event.is_set():
+                raise CancelledError("Drift validation cancelled")
+            
             # Check if file should be validated
             spec_section = self.map_file_to_spec_section(file_path)
             
@@ -712,7 +722,8 @@ class MultiFileValidator:
         """
         return self.alignment_detector.generate_drift_report(file_path)
     
-    def validate_staged_changes(self, staged_files: List[str]) -> Dict[str, Any]:
+    def validate_staged_changes(self, staged_files: List[str],
+                                cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
         """
         Validate all staged changes for a commit.
         
@@ -720,9 +731,13 @@ class MultiFileValidator:
         
         Args:
             staged_files: List of staged file paths
+            cancel_event: Event that, once set, stops validation before the next file
             
         Returns:
             Complete validation result with recommendations
+            
+        Raises:
+            CancelledError: If cancel_event is set before all files are validated
         """
         # Filter to only Python files in backend
         python_files = [
@@ -742,7 +757,7 @@ class MultiFileValidator:
             }
         
         # Validate all Python files
-        result = self.validate_multiple_files(python_files)
+        result = self.validate_multiple_files(python_files, cancel_event)
         
         # Add summary message
         if result['aligned']:
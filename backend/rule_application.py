@@ -6,25 +6,119 @@ including correlation pattern matching, minimal change policy application,
 and conflict detection.
 """
 import re
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Collection, Dict, List, Any, Mapping, Optional, Tuple
 from pathlib import Path
 
 
+@lru_cache(maxsize=512)
+def _compile_glob(pattern: str) -> re.Pattern:
+    """
+    Compile a glob-like steering rule pattern to an anchored regex.
+    
+    Supports ``*`` (any characters except /), ``**`` (any characters
+    including /) and ``{name}`` (a named capture of one path segment).
+    
+    Args:
+        pattern: Glob pattern
+        
+    Returns:
+        Compiled regex for the pattern
+    """
+    # Handle ** (match any path including /)
+    regex_pattern = pattern.replace('**/', '.*/')
+    regex_pattern = regex_pattern.replace('**', '.*')
+    
+    # Handle * (match any characters except /)
+    regex_pattern = regex_pattern.replace('*', '[^/]*')
+    
+    # Handle {name} captures
+    regex_pattern = regex_pattern.replace('{', '(?P<')
+    regex_pattern = regex_pattern.replace('}', '>[^/]+)')
+    
+    # Anchor the pattern
+    return re.compile(f'^{regex_pattern}$')
+
+
+@lru_cache(maxsize=512)
+def _compile_target(target_pattern: str) -> Tuple[str, ...]:
+    """
+    Split a target pattern into literal text and variable names.
+    
+    Even positions hold literal text and odd positions hold the names of
+    ``{name}`` placeholders, so ``tests/unit/test_{module}.py`` becomes
+    ``('tests/unit/test_', 'module', '.py')``.
+    
+    Args:
+        target_pattern: Target pattern with variable references
+        
+    Returns:
+        Tuple of alternating literal segments and variable names
+    """
+    return tuple(re.split(r'\{([^{}]*)\}', target_pattern))
+
+
+def _fill_target(parts: Tuple[str, ...], captured: Dict[str, str]) -> str:
+    """
+    Substitute captured variables into a split target pattern.
+    
+    Placeholders without a captured value are kept as written.
+    
+    Args:
+        parts: Target pattern split by _compile_target
+        captured: Variables captured from the source pattern
+        
+    Returns:
+        Expanded target pattern
+    """
+    if len(parts) == 1:
+        return parts[0]
+    return ''.join(
+        part if i % 2 == 0 else captured.get(part, f'{{{part}}}')
+        for i, part in enumerate(parts)
+    )
+
+
 class RuleApplicationEngine:
     """Engine for applying steering rules to validation contexts."""
     
-    def __init__(self, steering_rules: Dict[str, Any]):
+    def __init__(self, steering_rules: Mapping[str, Any]):
         """
         Initialize the rule application engine.
         
         Args:
-            steering_rules: Parsed steering rules dictionary
+            steering_rules: Parsed (read-only) steering rules
         """
         self.steering_rules = steering_rules
         self.correlation_patterns = steering_rules.get('correlation_patterns', {})
         self.ignore_patterns = steering_rules.get('ignore_patterns', [])
         self.validation_priorities = steering_rules.get('validation_priorities', {})
         self.minimal_change_policy = steering_rules.get('minimal_change_policy', {})
+        self._ignore_re = self._compile_ignore_patterns(self.ignore_patterns)
+        self._correlation_compiled = [
+            (_compile_glob(source_pattern),
+             [_compile_target(target_info['target']) for target_info in targets])
+            for source_pattern, targets in self.correlation_patterns.items()
+        ]
+    
+    @staticmethod
+    def _compile_ignore_patterns(patterns: List[str]) -> Optional[re.Pattern]:
+        """
+        Combine all ignore patterns into a single alternation regex.
+        
+        Args:
+            patterns: Glob-like ignore patterns
+            
+        Returns:
+            Compiled regex matching any ignore pattern, or None if there are
+            no patterns or they can't be combined (e.g. repeated capture names)
+        """
+        if not patterns:
+            return None
+        try:
+            return re.compile('|'.join(f'(?:{_compile_glob(p).pattern})' for p in patterns))
+        except re.error:
+            return None
     
     def apply_correlation_patterns(self, staged_files: List[str]) -> Dict[str, List[str]]:
         """
@@ -39,17 +133,20 @@ class RuleApplicationEngine:
         mappings = {}
         
         for file_path in staged_files:
-            mappings[file_path] = []
+            related = mappings[file_path] = []
             
             # Check each correlation pattern
-            for source_pattern, targets in self.correlation_patterns.items():
-                if self._matches_pattern(file_path, source_pattern):
-                    for target_info in targets:
-                        target_pattern = target_info['target']
-                        # Expand target pattern if it contains variables
-                        expanded_target = self._expand_pattern(file_path, source_pattern, target_pattern)
-                        if expanded_target not in mappings[file_path]:
-                            mappings[file_path].append(expanded_target)
+            for source_re, target_parts in self._correlation_compiled:
+                match = source_re.match(file_path)
+                if match is None:
+                    continue
+                
+                # Expand target patterns with the variables captured once
+                captured = match.groupdict()
+                for parts in target_parts:
+                    expanded_target = _fill_target(parts, captured)
+                    if expanded_target not in related:
+                        related.append(expanded_target)
         
         return mappings
     
@@ -63,19 +160,37 @@ class RuleApplicationEngine:
         Returns:
             Filtered list of files
         """
-        filtered = []
+        return self.partition_files(staged_files)[0]
+    
+    def partition_files(self, staged_files: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Split files into those kept and those matching ignore patterns.
+        
+        Args:
+            staged_files: List of staged file paths
+            
+        Returns:
+            Tuple of (kept files, ignored files), each in staged order
+        """
+        if not self.ignore_patterns:
+            return list(staged_files), []
+        
+        kept = []
+        ignored = []
+        ignore_re = self._ignore_re
         
         for file_path in staged_files:
-            should_ignore = False
-            for pattern in self.ignore_patterns:
-                if self._matches_pattern(file_path, pattern):
-                    should_ignore = True
-                    break
+            if ignore_re is not None:
+                # One regex scan per file instead of one call per pattern
+                should_ignore = ignore_re.match(file_path) is not None
+            else:
+                should_ignore = any(
+                    self._matches_pattern(file_path, pattern) for pattern in self.ignore_patterns
+                )
             
-            if not should_ignore:
-                filtered.append(file_path)
+            (ignored if should_ignore else kept).append(file_path)
         
-        return filtered
+        return kept, ignored
     
     def apply_minimal_change_policy(self, suggestions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -96,16 +211,19 @@ class RuleApplicationEngine:
         # For now, we don't filter suggestions, but we could add logic here
         # to detect and remove over-engineered suggestions based on policy
         
-        # Add policy context to each suggestion
+        # Add policy context to each suggestion as a plain dict, since the
+        # parsed rules are read-only mappings
+        policy = dict(self.minimal_change_policy)
         for suggestion in suggestions:
-            suggestion['minimal_change_policy'] = self.minimal_change_policy
+            suggestion['minimal_change_policy'] = policy
         
         return suggestions
     
     def detect_rule_drift_conflicts(self, 
                                    drift_issues: List[Dict[str, Any]], 
                                    filtered_files: List[str],
-                                   all_files: List[str]) -> List[Dict[str, Any]]:
+                                   all_files: List[str],
+                                   ignored_files: Optional[Collection[str]] = None) -> List[Dict[str, Any]]:
         """
         Detect conflicts between steering rules and detected drift.
         
@@ -117,6 +235,7 @@ class RuleApplicationEngine:
             drift_issues: List of detected drift issues
             filtered_files: Files after applying ignore patterns
             all_files: All staged files before filtering
+            ignored_files: Files removed by ignore patterns, if already known
             
         Returns:
             List of conflict notifications
@@ -124,7 +243,10 @@ class RuleApplicationEngine:
         conflicts = []
         
         # Find files that were filtered out but have drift
-        ignored_files = set(all_files) - set(filtered_files)
+        if ignored_files is None:
+            ignored_files = set(all_files) - set(filtered_files)
+        else:
+            ignored_files = set(ignored_files)
         
         for issue in drift_issues:
             issue_file = issue.get('file', '')
@@ -202,24 +324,7 @@ class RuleApplicationEngine:
         Returns:
             True if file matches pattern
         """
-        # Convert glob pattern to regex
-        regex_pattern = pattern
-        
-        # Handle ** (match any path including /)
-        regex_pattern = regex_pattern.replace('**/', '.*/')
-        regex_pattern = regex_pattern.replace('**', '.*')
-        
-        # Handle * (match any characters except /)
-        regex_pattern = regex_pattern.replace('*', '[^/]*')
-        
-        # Handle {name} captures
-        regex_pattern = regex_pattern.replace('{', '(?P<')
-        regex_pattern = regex_pattern.replace('}', '>[^/]+)')
-        
-        # Anchor the pattern
-        regex_pattern = f'^{regex_pattern}$'
-        
-        return bool(re.match(regex_pattern, file_path))
+        return _compile_glob(pattern).match(file_path) is not None
     
     def _expand_pattern(self, file_path: str, source_pattern: str, target_pattern: str) -> str:
         """
@@ -239,26 +344,13 @@ class RuleApplicationEngine:
         Returns:
             Expanded target pattern
         """
-        # Convert source pattern to regex with named groups
-        regex_pattern = source_pattern
-        regex_pattern = regex_pattern.replace('**/', '.*/')
-        regex_pattern = regex_pattern.replace('**', '.*')
-        regex_pattern = regex_pattern.replace('*', '[^/]*')
-        regex_pattern = regex_pattern.replace('{', '(?P<')
-        regex_pattern = regex_pattern.replace('}', '>[^/]+)')
-        regex_pattern = f'^{regex_pattern}$'
-        
-        # Match and extract variables
-        match = re.match(regex_pattern, file_path)
+        # Match source pattern (with named groups) and extract variables
+        match = _compile_glob(source_pattern).match(file_path)
         if not match:
             return target_pattern
         
         # Substitute variables in target pattern
-        result = target_pattern
-        for var_name, var_value in match.groupdict().items():
-            result = result.replace(f'{{{var_name}}}', var_value)
-        
-        return result
+        return _fill_target(_compile_target(target_pattern), match.groupdict())
     
     def get_priority_for_issue_type(self, issue_type: str) -> int:
         """
@@ -8,7 +8,13 @@ and minimal change policies.
 import re
 import os
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Sequence, Tuple
+
+
+# Parsed rules shared by every parser in the process, keyed by resolved
+# rules path and holding (mtime_ns, size, content, rules) for that file
+_PARSE_CACHE: Dict[str, Tuple[int, int, str, Mapping[str, Any]]] = {}
 
 
 class SteeringRulesParser:
@@ -23,22 +29,25 @@ class SteeringRulesParser:
         """
         self.rules_path = Path(rules_path)
         self.content: Optional[str] = None
-        self.correlation_patterns: Dict[str, List[Dict[str, str]]] = {}
-        self.ignore_patterns: List[str] = []
-        self.validation_priorities: Dict[str, int] = {}
-        self.minimal_change_policy: Dict[str, str] = {}
+        self.correlation_patterns: Mapping[str, Sequence[Dict[str, str]]] = {}
+        self.ignore_patterns: Sequence[str] = []
+        self.validation_priorities: Mapping[str, int] = {}
+        self.minimal_change_policy: Mapping[str, str] = {}
         self._last_modified: Optional[float] = None
-        self._cached_rules: Optional[Dict[str, Any]] = None
+        self._cached_rules: Optional[Mapping[str, Any]] = None
     
-    def parse(self, force_reload: bool = False) -> Dict[str, Any]:
+    def parse(self, force_reload: bool = False) -> Mapping[str, Any]:
         """
         Parse the steering rules document and extract all rules.
         
+        The parsed rules are read-only (mappings and tuples) so one parse
+        can be shared by every parser and rule engine without copying.
+        
         Args:
             force_reload: If True, bypass cache and reload from file
         
         Returns:
-            Dictionary containing all parsed rules
+            Read-only mapping containing all parsed rules
             
         Raises:
             FileNotFoundError: If steering rules file doesn't exist
@@ -50,11 +59,28 @@ class SteeringRulesParser:
                 return self._cached_rules
         
         # File doesn't exist or has been modified, parse it
-        if not self.rules_path.exists():
+        try:
+            stat = self.rules_path.stat()
+        except OSError:
             raise FileNotFoundError(f"Steering rules file not found: {self.rules_path}")
         
+        # Reuse another parser's result for the same unchanged file
+        cache_key = str(self.rules_path.resolve())
+        shared = _PARSE_CACHE.get(cache_key)
+        if (not force_reload and shared is not None
+                and shared[0] == stat.st_mtime_ns and shared[1] == stat.st_size):
+            self.content = shared[2]
+            self._last_modified = stat.st_mtime
+            rules = shared[3]
+            self.correlation_patterns = rules['correlation_patterns']
+            self.ignore_patterns = rules['ignore_patterns']
+            self.validation_priorities = rules['validation_priorities']
+            self.minimal_change_policy = rules['minimal_change_policy']
+            self._cached_rules = rules
+            return self._cached_rules
+        
         self.content = self.rules_path.read_text(encoding='utf-8')
-        self._last_modified = self._get_file_mtime()
+        self._last_modified = stat.st_mtime
         
         # Extract correlation patterns
         self._parse_correlation_patterns()
@@ -68,13 +94,20 @@ class SteeringRulesParser:
         # Extract minimal change policy
         self._parse_minimal_change_policy()
         
-        # Cache the results
-        self._cached_rules = {
+        # Freeze and cache the results
+        self.correlation_patterns = MappingProxyType({
+            source: tuple(targets) for source, targets in self.correlation_patterns.items()
+        })
+        self.ignore_patterns = tuple(self.ignore_patterns)
+        self.validation_priorities = MappingProxyType(self.validation_priorities)
+        self.minimal_change_policy = MappingProxyType(self.minimal_change_policy)
+        self._cached_rules = MappingProxyType({
             'correlation_patterns': self.correlation_patterns,
             'ignore_patterns': self.ignore_patterns,
             'validation_priorities': self.validation_priorities,
             'minimal_change_policy': self.minimal_change_policy
-        }
+        })
+        _PARSE_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, self.content, self._cached_rules)
         
         return self._cached_rules
     
@@ -172,45 +205,45 @@ class SteeringRulesParser:
                         value = parts[1].strip()
                         self.minimal_change_policy[key] = value
     
-    def get_correlation_patterns(self) -> Dict[str, List[Dict[str, str]]]:
+    def get_correlation_patterns(self) -> Mapping[str, Sequence[Dict[str, str]]]:
         """
         Get correlation patterns from parsed rules.
         
         Returns:
-            Dictionary mapping source patterns to target patterns
+            Read-only mapping of source patterns to target patterns
         """
         if self._cached_rules is None:
             self.parse()
         return self.correlation_patterns
     
-    def get_ignore_patterns(self) -> List[str]:
+    def get_ignore_patterns(self) -> Sequence[str]:
         """
         Get ignore patterns from parsed rules.
         
         Returns:
-            List of glob patterns to ignore
+            Tuple of glob patterns to ignore
         """
         if self._cached_rules is None:
             self.parse()
         return self.ignore_patterns
     
-    def get_validation_priorities(self) -> Dict[str, int]:
+    def get_validation_priorities(self) -> Mapping[str, int]:
         """
         Get validation priorities from parsed rules.
         
         Returns:
-            Dictionary mapping categories to priority numbers
+            Read-only mapping of categories to priority numbers
         """
         if self._cached_rules is None:
             self.parse()
         return self.validation_priorities
     
-    def get_minimal_change_policy(self) -> Dict[str, str]:
+    def get_minimal_change_policy(self) -> Mapping[str, str]:
         """
         Get minimal change policy from parsed rules.
         
         Returns:
-            Dictionary of policy guidelines
+            Read-only mapping of policy guidelines
         """
         if self._cached_rules is None:
             self.parse()
@@ -3,11 +3,38 @@ Suggestion generation module for SpecSync.
 
 This module provides functionality to generate actionable suggestions for
 resolving drift between specifications, code, tests, and documentation.
+
+Callers on a hot path that already hold the individual reports can skip the
+generate_suggestions_from_reports adapter and pass the issue lists directly:
+
+    generator.generate_all_suggestions(
+        drift_report.get('issues'),
+        test_report.get('issues'),
+        doc_report.get('issues')
+    )
 """
-from typing import Dict, List, Any, Optional
+import io
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, TextIO
 from pathlib import Path
 
 
+# Fields of a suggestion dict shown for each entry of a formatted report
+_GET_DISPLAY_FIELDS = itemgetter('type', 'priority', 'file', 'description', 'action', 'rationale')
+
+
+def _write_suggestion_entries(ordered_suggestions: List[Dict[str, Any]],
+                              write: Callable[[str], Any]) -> None:
+    """Write the numbered entries of a formatted suggestion report through write."""
+    for i, suggestion in enumerate(ordered_suggestions, 1):
+        t, p, f, d, a, r = _GET_DISPLAY_FIELDS(suggestion)
+        write(f"\n{i}. [{t.upper()}] Priority {p}\n"
+              f"   File: {f}\n"
+              f"   Description: {d}\n"
+              f"   Action: {a}\n"
+              f"   Rationale: {r}\n")
+
+
 class Suggestion:
     """Represents a single actionable suggestion for resolving drift."""
     
@@ -691,8 +718,9 @@ class ComprehensiveSuggestionGenerator:
         """
         Generate suggestions from complete validation reports.
         
-        This is a convenience method that extracts issues from reports
-        and generates suggestions.
+        This is a convenience adapter that extracts issues from reports
+        and generates suggestions. Callers that already hold the issue
+        lists should call generate_all_suggestions directly.
         
         Args:
             drift_report: Drift report from drift detector
@@ -702,20 +730,11 @@ class ComprehensiveSuggestionGenerator:
         Returns:
             Comprehensive prioritized report of all suggestions
         """
-        # Extract issues from reports
-        drift_issues = []
-        if drift_report and 'issues' in drift_report:
-            drift_issues = drift_report['issues']
-        
-        test_issues = []
-        if test_report and 'issues' in test_report:
-            test_issues = test_report['issues']
-        
-        doc_issues = []
-        if doc_report and 'issues' in doc_report:
-            doc_issues = doc_report['issues']
-        
-        return self.generate_all_suggestions(drift_issues, test_issues, doc_issues)
+        return self.generate_all_suggestions(
+            drift_report.get('issues') if drift_report else None,
+            test_report.get('issues') if test_report else None,
+            doc_report.get('issues') if doc_report else None
+        )
     
     def format_suggestions_for_display(self, report: Dict[str, Any]) -> str:
         """
@@ -727,32 +746,45 @@ class ComprehensiveSuggestionGenerator:
         Returns:
             Formatted string for display
         """
-        lines = []
+        buf = io.StringIO()
+        self._emit_suggestions(report, buf.write)
+        return buf.getvalue()
+    
+    def write_suggestions(self, report: Dict[str, Any], stream: TextIO) -> None:
+        """
+        Write suggestions as human-readable text directly to a stream.
+        
+        Produces the same text as format_suggestions_for_display, but writes
+        it incrementally so large reports are never held in memory as a
+        single string.
         
-        # Add summary
+        Args:
+            report: Prioritized suggestion report
+            stream: Text stream to write to (e.g. sys.stdout or an open file)
+        """
+        self._emit_suggestions(report, stream.write)
+    
+    def _emit_suggestions(self, report: Dict[str, Any], write: Callable[[str], Any]) -> None:
+        """Emit the formatted suggestion report through the given write callable."""
+        # Add summary and section header as one pre-shaped block; the summary
+        # schema is fixed, so the lookups are spelled out rather than looped
         summary = report['summary']
-        lines.append("=== Suggestion Summary ===")
-        lines.append(f"Total suggestions: {summary['total_suggestions']}")
-        lines.append(f"  - Spec updates: {summary['by_type']['spec']}")
-        lines.append(f"  - Test additions: {summary['by_type']['test']}")
-        lines.append(f"  - Documentation updates: {summary['by_type']['doc']}")
-        lines.append("")
-        lines.append(f"Priority breakdown:")
-        lines.append(f"  - High priority (8+): {summary['high_priority']}")
-        lines.append(f"  - Medium priority (5-7): {summary['medium_priority']}")
-        lines.append(f"  - Low priority (<5): {summary['low_priority']}")
-        lines.append("")
+        by_type = summary['by_type']
+        spec, test, doc = by_type['spec'], by_type['test'], by_type['doc']
+        high, medium, low = (summary['high_priority'], summary['medium_priority'],
+                             summary['low_priority'])
+        write("=== Suggestion Summary ===\n"
+              f"Total suggestions: {summary['total_suggestions']}\n"
+              f"  - Spec updates: {spec}\n"
+              f"  - Test additions: {test}\n"
+              f"  - Documentation updates: {doc}\n"
+              "\n"
+              "Priority breakdown:\n"
+              f"  - High priority (8+): {high}\n"
+              f"  - Medium priority (5-7): {medium}\n"
+              f"  - Low priority (<5): {low}\n"
+              "\n"
+              "=== Prioritized Suggestions ===\n")
         
         # Add ordered suggestions
-        lines.append("=== Prioritized Suggestions ===")
-        lines.append("")
-        
-        for i, suggestion in enumerate(report['ordered_suggestions'], 1):
-            lines.append(f"{i}. [{suggestion['type'].upper()}] Priority {suggestion['priority']}")
-            lines.append(f"   File: {suggestion['file']}")
-            lines.append(f"   Description: {suggestion['description']}")
-            lines.append(f"   Action: {suggestion['action']}")
-            lines.append(f"   Rationale: {suggestion['rationale']}")
-            lines.append("")
-        
-        return "\n".join(lines)
+        _write_suggestion_entries(report['ordered_suggestions'], write)
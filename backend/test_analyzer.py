@@ -5,9 +5,12 @@ This module provides functionality to analyze test coverage by mapping
 code files to their corresponding test files and extracting tested functions.
 """
 import ast
+import os
 import re
+import threading
+from concurrent.futures import CancelledError
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, FrozenSet, List, Optional, Set, Any
 
 
 class TestFileMapper:
@@ -22,6 +25,27 @@ class TestFileMapper:
         """
         self.project_root = Path(project_root)
         self.test_dir = self.project_root / "tests"
+        self._dir_listings: Dict[Path, FrozenSet[str]] = {}
+    
+    def _list_files(self, directory: Path) -> FrozenSet[str]:
+        """
+        List the file names in a directory, scanning it once per mapper.
+        
+        Args:
+            directory: Directory to list
+            
+        Returns:
+            Names of the files in the directory (empty if it doesn't exist)
+        """
+        listing = self._dir_listings.get(directory)
+        if listing is None:
+            try:
+                with os.scandir(directory) as entries:
+                    listing = frozenset(entry.name for entry in entries if entry.is_file())
+            except OSError:
+                listing = frozenset()
+            self._dir_listings[directory] = listing
+        return listing
     
     def map_code_to_test_file(self, code_file: str) -> List[str]:
         """
@@ -57,14 +81,16 @@ class TestFileMapper:
         
         found_test_files = []
         
+        # Each directory is scanned once and then checked by name, rather
+        # than stat-ing every candidate path for every code file
         for test_dir in test_locations:
-            if not test_dir.exists():
+            existing = self._list_files(test_dir)
+            if not existing:
                 continue
             
             for pattern in test_file_patterns:
-                test_file = test_dir / pattern
-                if test_file.exists():
-                    found_test_files.append(str(test_file))
+                if pattern in existing:
+                    found_test_files.append(str(test_dir / pattern))
         
         return found_test_files
     
@@ -667,16 +693,21 @@ class TestCoverageDetector:
         
         return issues
     
-    def generate_coverage_report(self, code_files: List[str], test_files: Optional[List[str]] = None) -> TestCoverageReport:
+    def generate_coverage_report(self, code_files: List[str], test_files: Optional[List[str]] = None,
+                                 cancel_event: Optional[threading.Event] = None) -> TestCoverageReport:
         """
         Generate a comprehensive test coverage report.
         
         Args:
             code_files: List of code files to check
             test_files: Optional list of test files to validate alignment
+            cancel_event: Event that, once set, stops the report before the next file
             
         Returns:
             TestCoverageReport with all detected issues
+            
+        Raises:
+            CancelledError: If cancel_event is set before all files are checked
         """
         report = TestCoverageReport()
         
@@ -685,6 +716,9 @@ class TestCoverageDetector:
         
         # Detect issues for each code file
         for code_file in code_files:
+            if cancel_event is not None and cancel_event.is_set():
+                raise CancelledError("Test coverage validation cancelled")
+            
             # Check for missing test files
             missing_issues = self.detect_missing_test_files(code_file)
             for issue in missing_issues:
@@ -698,13 +732,16 @@ class TestCoverageDetector:
         # Validate test-code-spec alignment for test files
         if test_files:
             for test_file in test_files:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise CancelledError("Test coverage validation cancelled")
                 alignment_issues = self.validate_test_code_spec_alignment(test_file)
                 for issue in alignment_issues:
                     report.add_issue(issue)
         
         return report
     
-    def validate_staged_changes(self, staged_files: List[str]) -> TestCoverageReport:
+    def validate_staged_changes(self, staged_files: List[str],
+                                cancel_event: Optional[threading.Event] = None) -> TestCoverageReport:
         """
         Validate test coverage for staged changes.
         
@@ -712,13 +749,17 @@ class TestCoverageDetector:
         
         Args:
             staged_files: List of staged file paths
+            cancel_event: Event that, once set, stops validation before the next file
             
         Returns:
             TestCoverageReport with coverage validation results
+            
+        Raises:
+            CancelledError: If cancel_event is set before all files are checked
         """
         # Separate code files and test files
         code_files = [f for f in staged_files if f.endswith('.py') and f.startswith('backend/') and not 'test' in f]
         test_files = [f for f in staged_files if f.endswith('.py') and 'test' in f]
         
         # Generate comprehensive report
-        return self.generate_coverage_report(code_files, test_files)
+        return self.generate_coverage_report(code_files, test_files, cancel_event)
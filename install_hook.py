@@ -8,30 +8,34 @@ It creates a pre-commit hook that triggers Kiro validation before commits are fi
 
 import json
 import os
+import subprocess
 import sys
 from pathlib import Path
 
 
 def find_git_root():
     """Find the root of the git repository."""
-    current = Path.cwd()
-    while current != current.parent:
-        if (current / ".git").exists():
-            return current
-        current = current.parent
-    return None
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    return Path(result.stdout.strip())
 
 
 def load_hook_config():
     """Load the hook configuration from .kiro/hooks/precommit.json."""
     config_path = Path(".kiro/hooks/precommit.json")
-    if not config_path.exists():
-        print(f"Error: Hook configuration not found at {config_path}")
-        return None
-    
     try:
         with open(config_path, "r") as f:
             return json.load(f)
+    except FileNotFoundError:
+        print(f"Error: Hook configuration not found at {config_path}")
+        return None
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON in hook configuration: {e}")
         return None
@@ -66,6 +70,17 @@ echo "SpecSync validation complete."
 exit 0
 """
     
+    # Leave an identical, executable hook untouched so reinstalling doesn't
+    # change its mtime or wake up file watchers
+    try:
+        with open(hook_path, "r") as f:
+            existing = f.read()
+    except (FileNotFoundError, UnicodeDecodeError):
+        existing = None
+    if existing == hook_script and (os.name == "nt" or os.access(hook_path, os.X_OK)):
+        print("Pre-commit hook is already up to date.")
+        return True
+    
     try:
         with open(hook_path, "w") as f:
             f.write(hook_script)
@@ -126,14 +141,13 @@ def uninstall_hook():
         return False
     
     hook_path = git_root / ".git" / "hooks" / "pre-commit"
-    if not hook_path.exists():
-        print("No pre-commit hook found.")
-        return False
-    
     try:
         hook_path.unlink()
         print(f"✓ Pre-commit hook removed from {hook_path}")
         return True
+    except FileNotFoundError:
+        print("No pre-commit hook found.")
+        return False
     except Exception as e:
         print(f"Error: Failed to remove hook: {e}")
         return False
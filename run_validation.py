@@ -4,68 +4,115 @@ Standalone validation runner for SpecSync pre-commit hook.
 This script runs validation on staged changes and returns appropriate exit codes.
 """
 
+import os
 import sys
 import subprocess
+import hashlib
+import io
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 
-# Add backend to path
+# Add backend to path; backend modules are imported where they are first
+# needed, so commits that skip validation don't pay for loading them
 sys.path.insert(0, str(Path(__file__).parent))
 
-from backend.validator import ValidationOrchestrator
-from backend.drift_detector import DriftDetector
-from backend.test_analyzer import TestCoverageDetector
-from backend.doc_analyzer import DocumentationAlignmentDetector
-from backend.suggestion_generator import SuggestionGenerator
-from backend.auto_remediation import enable_auto_remediation
-from backend.auto_fix import enable_auto_fix, get_auto_fix_instructions
+
+# Rule framing the sections of the validation report
+_RULE = "=" * 70
+
+# File extensions that can affect spec, test or doc alignment; overridable
+# with "watched_extensions" in the validation section of specsync.json
+WATCHED_EXTENSIONS = ('.py', '.md', '.yaml', '.yml', '.json')
+
+# Successful results of earlier runs, keyed by staged content, configuration
+# and the spec and steering files, are reused for this long so re-running a
+# commit with the same inputs (e.g. after an aborted commit message) skips
+# validation. They are kept inside the git directory, out of the work tree
+CACHE_DIR_NAME = "specsync-cache"
+CACHE_TTL_SECONDS = 600
+
+# Files besides the staged changes whose edits change validation results
+CACHE_INPUT_FILES = (
+    '.kiro/specs/app.yaml',
+    '.kiro/steering/rules.md',
+    '.kiro/settings/bridge.json'
+)
+
+# Values of GIT_REFLOG_ACTION for commands that replay existing commits;
+# the hook is skipped for them unless SPECSYNC_FORCE=1 is set
+REPLAY_ACTIONS = ('rebase', 'cherry-pick', 'merge')
+
+# Options shared by every git invocation. Commands are argv lists run
+# without a shell, and git is told not to take optional index locks
+_GIT_RUN_KWARGS = {
+    'capture_output': True,
+    'text': True,
+    'check': True,
+    'encoding': 'utf-8',
+    'errors': 'replace',
+    'env': {**os.environ, 'GIT_OPTIONAL_LOCKS': '0'}
+}
+
+
+def _emit(*lines):
+    """Write several output lines with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _as_dict(obj):
+    """Return a report as a dict, whether it was produced as a dict or an object."""
+    if obj is None or isinstance(obj, dict):
+        return obj
+    try:
+        return vars(obj)
+    except TypeError:
+        # Objects declaring __slots__ have no instance __dict__
+        return {name: getattr(obj, name) for name in obj.__slots__ if hasattr(obj, name)}
+
+
+def _format_items(items, limit, fmt):
+    """Format the first `limit` items as report lines, noting how many were left out."""
+    lines = [fmt(_as_dict(item)) for item in items[:limit]]
+    if len(items) > limit:
+        lines.append(f"   ... and {len(items) - limit} more")
+    return lines
+
+
+def _run_git(*args):
+    """Run git with the given arguments and return its stdout (raises CalledProcessError on failure)."""
+    return subprocess.run(['git', *args], **_GIT_RUN_KWARGS).stdout
 
 
 def get_git_context():
-    """Get git context (staged files and diff)."""
+    """
+    Get git context (branch and staged files).
+    
+    "diff" is intentionally left empty: no analyzer reads the staged diff
+    (each one works from the staged file list), so it isn't captured.
+    """
     try:
-        # Get current branch
-        branch_result = subprocess.run(
-            "git rev-parse --abbrev-ref HEAD",
-            capture_output=True,
-            text=True,
-            check=True,
-            shell=True,
-            encoding='utf-8',
-            errors='replace'
-        )
-        branch = branch_result.stdout.strip()
-        
-        # Get staged files
-        files_result = subprocess.run(
-            "git diff --cached --name-only",
-            capture_output=True,
-            text=True,
-            check=True,
-            shell=True,
-            encoding='utf-8',
-            errors='replace'
-        )
-        staged_files = [f.strip() for f in files_result.stdout.split('\n') if f.strip()]
-        
-        # Get diff (with error handling for unicode)
-        diff_result = subprocess.run(
-            "git diff --cached",
-            capture_output=True,
-            text=True,
-            check=True,
-            shell=True,
-            encoding='utf-8',
-            errors='replace'
-        )
-        diff = diff_result.stdout
+        # The queries are independent, so run them concurrently; each
+        # thread just waits on its git process
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            branch_future = executor.submit(_run_git, "rev-parse", "--abbrev-ref", "HEAD")
+            files_future = executor.submit(_run_git, "diff", "--cached", "--name-only")
+            
+            # Get staged files
+            staged_files = [f.strip() for f in files_future.result().split('\n') if f.strip()]
+            
+            # Get current branch
+            branch = branch_future.result().strip()
         
         return {
             "branch": branch,
             "stagedFiles": staged_files,
-            "diff": diff
+            "diff": ""
         }
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        # FileNotFoundError: git itself isn't installed or on PATH
         print(f"[ERROR] Error getting git context: {e}")
         return None
 
@@ -73,9 +120,11 @@ def get_git_context():
 def load_config():
     """Load SpecSync configuration."""
     config_path = Path(".kiro/settings/specsync.json")
-    if config_path.exists():
+    try:
         with open(config_path, 'r') as f:
             return json.load(f)
+    except FileNotFoundError:
+        pass
     return {
         "auto_remediation": {"enabled": False, "mode": "tasks"},
         "semi_auto_fix": {"enabled": False},
@@ -83,21 +132,129 @@ def load_config():
     }
 
 
+def has_relevant_changes(staged_files, config):
+    """Check whether any staged file can affect validation results."""
+    # Bridge contracts can be affected by source files of any type
+    if Path(".kiro/settings/bridge.json").exists():
+        return True
+    watched = tuple(config.get("validation", {}).get("watched_extensions", WATCHED_EXTENSIONS))
+    return any(f.endswith(watched) for f in staged_files)
+
+
+def _update_with_stat(key, path):
+    """Fold a file's path, modification time and size into a cache key."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        key.update(f"{path}\0missing\n".encode('utf-8', 'surrogateescape'))
+        return
+    key.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode('utf-8', 'surrogateescape'))
+
+
+def get_cache_path(config, staged_files):
+    """Get the result cache file for the current validation inputs, or None if they can't be identified."""
+    from backend.validator import get_staging_area_state
+    staging_state = get_staging_area_state()
+    if not staging_state:
+        return None
+    try:
+        git_dir = _run_git("rev-parse", "--git-dir").strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    
+    key = hashlib.blake2b(digest_size=16)
+    key.update(staging_state.encode('utf-8'))
+    key.update(json.dumps(config, sort_keys=True).encode('utf-8'))
+    
+    # The analyzers read the working tree copy of staged files, plus the
+    # spec, steering rules and bridge settings
+    for path in (*staged_files, *CACHE_INPUT_FILES):
+        _update_with_stat(key, path)
+    
+    return Path(git_dir) / CACHE_DIR_NAME / f"validation_{key.hexdigest()}.json"
+
+
+def is_cacheable(result):
+    """Check whether a validation result can be reused for the same inputs."""
+    # Only complete, successful runs are replayed; failures are re-validated
+    # so their issues (and any remediation) are reported every time
+    return (
+        result.get('success', False)
+        and not result.get('timed_out')
+        and not result.get('partial_results')
+        and result.get('staging_area_preserved') is not False
+    )
+
+
+def load_cached_result(cache_path):
+    """Load a cached validation result if one exists and hasn't expired."""
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if time.time() - cached.get('timestamp', 0) > CACHE_TTL_SECONDS:
+        return None
+    return cached
+
+
+def save_cached_result(cache_path, exit_code, message):
+    """Save a validation result atomically and remove entries that have expired."""
+    try:
+        cache_dir = cache_path.parent
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if now - entry.stat().st_mtime > CACHE_TTL_SECONDS:
+                    os.unlink(entry.path)
+        
+        tmp_path = cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'exit_code': exit_code, 'message': message, 'timestamp': now}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Caching is best-effort; the next run simply validates again
+        pass
+
+
 def get_commit_message():
     """Get the commit message from git."""
     try:
-        # Try to get the message from COMMIT_EDITMSG
-        commit_msg_file = Path(".git/COMMIT_EDITMSG")
-        if commit_msg_file.exists():
-            with open(commit_msg_file, 'r') as f:
-                return f.readline().strip()
-    except:
+        # Try to get the message from COMMIT_EDITMSG. Only its first line is
+        # used, so read raw blocks until the first newline rather than going
+        # through the text IO stack, and decode once the line is complete so
+        # a multi-byte character is never split
+        fd = os.open(".git/COMMIT_EDITMSG", os.O_RDONLY)
+        try:
+            first_line = b""
+            while b"\n" not in first_line:
+                block = os.read(fd, 256)
+                if not block:
+                    break
+                first_line += block
+        finally:
+            os.close(fd)
+        return first_line.split(b"\n", 1)[0].decode('utf-8', errors='replace').strip()
+    except OSError:
         pass
     return "Current commit"
 
 
+def should_skip():
+    """Check whether the environment asks for validation to be skipped."""
+    if os.environ.get("SPECSYNC_SKIP") == "1":
+        return True
+    if os.environ.get("SPECSYNC_FORCE") == "1":
+        return False
+    return os.environ.get("GIT_REFLOG_ACTION", "").startswith(REPLAY_ACTIONS)
+
+
 def main():
     """Run validation on staged changes."""
+    if should_skip():
+        return 0
+    
     print("Initializing SpecSync validation...")
     
     # Load configuration
@@ -105,15 +262,18 @@ def main():
     auto_remediation_enabled = config.get("auto_remediation", {}).get("enabled", False)
     remediation_mode = config.get("auto_remediation", {}).get("mode", "tasks")
     semi_auto_enabled = config.get("semi_auto_fix", {}).get("enabled", False)
-    allow_commit_with_tasks = config.get("validation", {}).get("allow_commit_with_tasks", True)
     
     if auto_remediation_enabled:
         if remediation_mode == "semi-auto" and semi_auto_enabled:
-            print("🤖 Semi-automatic fix mode: ENABLED")
-            print("   You will need to manually ask Kiro to fix drift after commit")
+            _emit(
+                "🤖 Semi-automatic fix mode: ENABLED",
+                "   You will need to manually ask Kiro to fix drift after commit"
+            )
         else:
-            print("[*] Auto-remediation mode: ENABLED")
-            print("   Tasks will be generated for any detected drift")
+            _emit(
+                "[*] Auto-remediation mode: ENABLED",
+                "   Tasks will be generated for any detected drift"
+            )
         print()
     
     # Get git context
@@ -128,136 +288,178 @@ def main():
         print("ℹ️  No files staged for commit")
         return 0
     
-    print(f"[*] Validating {len(staged_files)} staged file(s)...")
-    print()
+    if not has_relevant_changes(staged_files, config):
+        print("ℹ️  No staged files affect spec, test or doc alignment - skipping validation")
+        return 0
+    
+    # Reuse the result of an earlier run on the same staged changes
+    cache_path = get_cache_path(config, staged_files)
+    cached = load_cached_result(cache_path) if cache_path else None
+    if cached is not None:
+        _emit(
+            "ℹ️  Staged changes unchanged since the last successful validation - reusing its result",
+            f"   Message: {cached.get('message')}"
+        )
+        return cached['exit_code']
+    
+    _emit(
+        f"[*] Validating {len(staged_files)} staged file(s)...",
+        ""
+    )
     
     # Initialize orchestrator
-    orchestrator = ValidationOrchestrator()
+    from backend.validator import get_orchestrator
+    orchestrator = get_orchestrator()
     
     # Run validation
-    result = orchestrator.validate(git_context)
+    result = _as_dict(orchestrator.validate(git_context))
+    
+    # Collect the whole report and write it out at once
+    report = io.StringIO()
+    try:
+        with redirect_stdout(report):
+            exit_code = report_results(result, config)
+    finally:
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+    
+    if cache_path and is_cacheable(result):
+        save_cached_result(cache_path, exit_code, result.get('message', 'Unknown'))
+    
+    return exit_code
+
+
+def report_results(result, config):
+    """Display validation results and return the hook exit code."""
+    auto_remediation_enabled = config.get("auto_remediation", {}).get("enabled", False)
+    remediation_mode = config.get("auto_remediation", {}).get("mode", "tasks")
+    semi_auto_enabled = config.get("semi_auto_fix", {}).get("enabled", False)
+    allow_commit_with_tasks = config.get("validation", {}).get("allow_commit_with_tasks", True)
     
     # Display results
-    print()
-    print("=" * 70)
-    print("  VALIDATION RESULTS")
-    print("=" * 70)
-    print()
+    _emit(
+        "",
+        _RULE,
+        "  VALIDATION RESULTS",
+        _RULE,
+        ""
+    )
     
-    # Handle both dict and object results
-    if isinstance(result, dict):
-        success = result.get('success', False)
-        message = result.get('message', 'Unknown')
-        drift_report = result.get('drift_report')
-        test_report = result.get('test_report')
-        doc_report = result.get('doc_report')
-        bridge_report = result.get('bridge_report')
-        suggestions = result.get('suggestions', [])
-    else:
-        success = result.success
-        message = result.message
-        drift_report = result.drift_report
-        test_report = result.test_report
-        doc_report = result.doc_report
-        bridge_report = getattr(result, 'bridge_report', None)
-        suggestions = result.suggestions
+    success = result.get('success', False)
+    message = result.get('message', 'Unknown')
+    drift_report = _as_dict(result.get('drift_report'))
+    test_report = _as_dict(result.get('test_report'))
+    doc_report = _as_dict(result.get('doc_report'))
+    bridge_report = result.get('bridge_report')
+    suggestions = result.get('suggestions', [])
     
     if success:
-        print("[OK] SUCCESS: All validations passed")
-        print()
-        print(f"   Message: {message}")
+        _emit(
+            "[OK] SUCCESS: All validations passed",
+            "",
+            f"   Message: {message}"
+        )
         return 0
     
     # Validation failed - check if we should allow commit anyway
-    print("[WARN] WARNING: Validation issues detected")
-    print()
-    print(f"   Message: {message}")
-    print()
+    _emit(
+        "[WARN] WARNING: Validation issues detected",
+        "",
+        f"   Message: {message}",
+        ""
+    )
     
     # Check if we should allow commit with warnings
     block_on_drift = config.get("validation", {}).get("block_on_drift", True)
     
     # Auto-remediation mode
     if auto_remediation_enabled:
-        print()
-        print("=" * 70)
-        
-        # Convert result to dict if needed
-        if isinstance(result, dict):
-            result_dict = result
-        else:
-            result_dict = {
-                'success': success,
-                'message': message,
-                'drift_report': drift_report,
-                'test_report': test_report,
-                'doc_report': doc_report,
-                'suggestions': suggestions
-            }
+        _emit(
+            "",
+            _RULE
+        )
         
         # Check mode
         if remediation_mode == "semi-auto" and semi_auto_enabled:
-            print("  SEMI-AUTOMATIC FIX MODE")
-            print("=" * 70)
-            print()
+            _emit(
+                "  SEMI-AUTOMATIC FIX MODE",
+                _RULE,
+                ""
+            )
             
             # Get commit message
             commit_msg = get_commit_message()
             
             # Execute auto-fix
-            auto_fix_result = enable_auto_fix(result_dict, config, commit_msg)
+            from backend.auto_fix import enable_auto_fix
+            auto_fix_result = enable_auto_fix(result, config, commit_msg)
             
             if auto_fix_result.get('requires_kiro_agent', False):
-                print("🤖 Semi-Automatic Fix Available")
-                print()
-                print(f"   Estimated effort: {auto_fix_result.get('estimated_credits', 'Unknown')} issues to fix")
-                print()
-                print("📋 What needs fixing:")
+                _emit(
+                    "🤖 Semi-Automatic Fix Available",
+                    "",
+                    f"   Estimated effort: {auto_fix_result.get('estimated_credits', 'Unknown')} issues to fix",
+                    "",
+                    "📋 What needs fixing:"
+                )
                 for fix in auto_fix_result.get('fixes_applied', []):
                     print(f"   • {fix}")
-                print()
-                print("🔄 Next Steps:")
-                print("   1. Your commit will proceed")
-                print("   2. Open Kiro chat")
-                print("   3. Say: 'Fix the drift from my last commit'")
-                print("   4. Kiro will make all fixes")
-                print("   5. Kiro will create a follow-up commit")
-                print()
-                print("=" * 70)
-                print()
-                print("[OK] Commit ALLOWED - Manual Kiro invocation required")
-                print()
-                print("[TIP] After commit, open Kiro and say:")
-                print("   'Fix the drift from my last commit'")
-                print()
+                _emit(
+                    "",
+                    "🔄 Next Steps:",
+                    "   1. Your commit will proceed",
+                    "   2. Open Kiro chat",
+                    "   3. Say: 'Fix the drift from my last commit'",
+                    "   4. Kiro will make all fixes",
+                    "   5. Kiro will create a follow-up commit",
+                    "",
+                    _RULE,
+                    "",
+                    "[OK] Commit ALLOWED - Manual Kiro invocation required",
+                    "",
+                    "[TIP] After commit, open Kiro and say:",
+                    "   'Fix the drift from my last commit'",
+                    ""
+                )
                 return 0  # Allow commit
             else:
-                print(f"[FAIL] Semi-auto fix failed: {auto_fix_result.get('message')}")
-                print()
+                _emit(
+                    f"[FAIL] Semi-auto fix failed: {auto_fix_result.get('message')}",
+                    ""
+                )
                 return 1
         
         else:
             # Task generation mode
-            print("  AUTO-REMEDIATION MODE")
-            print("=" * 70)
-            print()
+            _emit(
+                "  AUTO-REMEDIATION MODE",
+                _RULE,
+                ""
+            )
             
             # Generate remediation tasks
-            remediation_message = enable_auto_remediation(result_dict, feature_name="app")
-            print(remediation_message)
-            print()
-            print("=" * 70)
-            print()
+            from backend.auto_remediation import enable_auto_remediation
+            remediation_message = enable_auto_remediation(result, feature_name="app")
+            _emit(
+                remediation_message,
+                "",
+                _RULE,
+                ""
+            )
             
             if allow_commit_with_tasks:
-                print("[OK] Commit ALLOWED with remediation tasks generated")
-                print("   Please complete the tasks in the generated file")
-                print()
+                _emit(
+                    "[OK] Commit ALLOWED with remediation tasks generated",
+                    "   Please complete the tasks in the generated file",
+                    ""
+                )
                 return 0  # Allow commit
             else:
-                print("[BLOCKED] Commit BLOCKED - Fix issues before committing")
-                print("   (Set 'allow_commit_with_tasks: true' to allow commits with tasks)")
-                print()
+                _emit(
+                    "[BLOCKED] Commit BLOCKED - Fix issues before committing",
+                    "   (Set 'allow_commit_with_tasks: true' to allow commits with tasks)",
+                    ""
+                )
                 return 1  # Block commit
     
     # Standard mode (no auto-remediation)
@@ -265,73 +467,73 @@ def main():
     
     # Show drift issues
     if drift_report:
-        aligned = drift_report.get('aligned', True) if isinstance(drift_report, dict) else drift_report.aligned
-        if not aligned:
-            issues = drift_report.get('issues', []) if isinstance(drift_report, dict) else drift_report.issues
-            print("[INFO] Drift Issues:")
-            print(f"   Total: {len(issues)}")
-            for issue in issues[:5]:  # Show first 5
-                if isinstance(issue, dict):
-                    print(f"   • [{issue.get('type')}] {issue.get('file')}: {issue.get('description')}")
-                else:
-                    print(f"   • [{issue.type}] {issue.file}: {issue.description}")
-            if len(issues) > 5:
-                print(f"   ... and {len(issues) - 5} more")
-            print()
+        if not drift_report.get('aligned', True):
+            issues = drift_report.get('issues', [])
+            _emit(
+                "[INFO] Drift Issues:",
+                f"   Total: {len(issues)}",
+                *_format_items(  # Show first 5
+                    issues, 5,
+                    lambda issue: f"   • [{issue.get('type')}] {issue.get('file')}: {issue.get('description')}"
+                ),
+                ""
+            )
     
     # Show test coverage issues
     if test_report:
-        has_issues = test_report.get('has_issues', False) if isinstance(test_report, dict) else test_report.has_issues
-        if has_issues:
-            issues = test_report.get('issues', []) if isinstance(test_report, dict) else test_report.issues
-            print("🧪 Test Coverage Issues:")
-            print(f"   Total: {len(issues)}")
-            for issue in issues[:3]:  # Show first 3
-                if isinstance(issue, dict):
-                    print(f"   • [{issue.get('type')}] {issue.get('description')}")
-                else:
-                    print(f"   • [{issue.type}] {issue.description}")
-            if len(issues) > 3:
-                print(f"   ... and {len(issues) - 3} more")
-            print()
+        if test_report.get('has_issues', False):
+            issues = test_report.get('issues', [])
+            _emit(
+                "🧪 Test Coverage Issues:",
+                f"   Total: {len(issues)}",
+                *_format_items(  # Show first 3
+                    issues, 3,
+                    lambda issue: f"   • [{issue.get('type')}] {issue.get('description')}"
+                ),
+                ""
+            )
     
     # Show documentation issues
     if doc_report:
-        has_issues = doc_report.get('has_issues', False) if isinstance(doc_report, dict) else doc_report.has_issues
-        if has_issues:
-            issues = doc_report.get('issues', []) if isinstance(doc_report, dict) else doc_report.issues
-            print("📚 Documentation Issues:")
-            print(f"   Total: {len(issues)}")
-            for issue in issues[:3]:  # Show first 3
-                if isinstance(issue, dict):
-                    print(f"   • [{issue.get('type')}] {issue.get('description')}")
-                else:
-                    print(f"   • [{issue.type}] {issue.description}")
-            if len(issues) > 3:
-                print(f"   ... and {len(issues) - 3} more")
-            print()
+        if doc_report.get('has_issues', False):
+            issues = doc_report.get('issues', [])
+            _emit(
+                "📚 Documentation Issues:",
+                f"   Total: {len(issues)}",
+                *_format_items(  # Show first 3
+                    issues, 3,
+                    lambda issue: f"   • [{issue.get('type')}] {issue.get('description')}"
+                ),
+                ""
+            )
     
     # Show bridge contract drift issues
     if bridge_report and bridge_report.get('enabled', False):
         has_issues = bridge_report.get('has_issues', False)
         if has_issues:
             issues = bridge_report.get('issues', [])
-            print("🌉 Bridge Contract Drift:")
-            print(f"   Total: {len(issues)}")
-            print(f"   Dependencies: {', '.join(bridge_report.get('dependencies_checked', []))}")
-            for issue in issues[:3]:  # Show first 3
-                print(f"   • [{issue['dependency']}] {issue['method']} {issue['endpoint']}")
-                print(f"     {issue['message']}")
-            if len(issues) > 3:
-                print(f"   ... and {len(issues) - 3} more")
-            print()
+            _emit(
+                "🌉 Bridge Contract Drift:",
+                f"   Total: {len(issues)}",
+                f"   Dependencies: {', '.join(bridge_report.get('dependencies_checked', []))}",
+                *_format_items(  # Show first 3
+                    issues, 3,
+                    lambda issue: (
+                        f"   • [{issue['dependency']}] {issue['method']} {issue['endpoint']}\n"
+                        f"     {issue['message']}"
+                    )
+                ),
+                ""
+            )
         else:
             # Show success message for bridge
             deps = bridge_report.get('dependencies_checked', [])
             if deps:
-                print("🌉 Bridge Contract Status:")
-                print(f"   ✓ All API calls align with contracts ({len(deps)} dependencies checked)")
-                print()
+                _emit(
+                    "🌉 Bridge Contract Status:",
+                    f"   ✓ All API calls align with contracts ({len(deps)} dependencies checked)",
+                    ""
+                )
     
     # Show suggestions
     if suggestions:
@@ -344,24 +546,26 @@ def main():
             suggestions_list = []
         
         if suggestions_list:
-            print("💡 Suggestions:")
-            for i, suggestion in enumerate(suggestions_list[:5], 1):
-                if isinstance(suggestion, dict):
-                    print(f"   {i}. [{suggestion.get('type', '').upper()}] {suggestion.get('description')}")
-                else:
-                    print(f"   {i}. [{suggestion.type.upper()}] {suggestion.description}")
+            lines = [
+                f"   {i}. [{suggestion.get('type', '').upper()}] {suggestion.get('description')}"
+                for i, suggestion in enumerate(map(_as_dict, suggestions_list[:5]), 1)
+            ]
             if len(suggestions_list) > 5:
-                print(f"   ... and {len(suggestions_list) - 5} more suggestions")
-            print()
+                lines.append(f"   ... and {len(suggestions_list) - 5} more suggestions")
+            _emit("💡 Suggestions:", *lines, "")
     
-    print("=" * 70)
-    print()
+    _emit(
+        _RULE,
+        ""
+    )
     
     # Final decision: block or allow based on configuration
     if not block_on_drift:
-        print("[OK] Commit ALLOWED (block_on_drift is disabled)")
-        print("   Validation issues detected but commit is allowed per configuration")
-        print()
+        _emit(
+            "[OK] Commit ALLOWED (block_on_drift is disabled)",
+            "   Validation issues detected but commit is allowed per configuration",
+            ""
+        )
         return 0
     
     return 1
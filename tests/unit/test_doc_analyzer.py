@@ -2,7 +2,6 @@
 Unit tests for the documentation analyzer module.
 """
 import pytest
-from pathlib import Path
 from backend.doc_analyzer import (
     MarkdownParser,
     DocumentationMapper,
@@ -13,6 +12,32 @@ from backend.doc_analyzer import (
 )
 
 
+@pytest.fixture(scope="module")
+def users_parser():
+    """Parse the users API documentation once for the whole module."""
+    parser = MarkdownParser("docs/api/users.md")
+    parser.parse()
+    return parser
+
+
+@pytest.fixture(scope="module")
+def mapper():
+    """Build one documentation mapper, and its docs scan, for the whole module."""
+    return DocumentationMapper(".")
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    """Build one documentation analyzer (and its parsed spec) for the whole module."""
+    return DocumentationAnalyzer(".", ".kiro/specs/app.yaml")
+
+
+@pytest.fixture(scope="module")
+def detector():
+    """Build one documentation alignment detector for the whole module."""
+    return DocumentationAlignmentDetector(".", ".kiro/specs/app.yaml")
+
+
 class TestMarkdownParser:
     """Tests for MarkdownParser class."""
     
@@ -32,10 +57,9 @@ class TestMarkdownParser:
         with pytest.raises(FileNotFoundError):
             parser.parse()
     
-    def test_extract_api_descriptions(self):
+    def test_extract_api_descriptions(self, users_parser):
         """Test extracting API endpoint descriptions from documentation."""
-        parser = MarkdownParser("docs/api/users.md")
-        endpoints = parser.extract_api_descriptions()
+        endpoints = users_parser.extract_api_descriptions()
         
         assert len(endpoints) > 0
         
@@ -49,30 +73,26 @@ class TestMarkdownParser:
         assert 'path' in endpoint
         assert 'description' in endpoint
     
-    def test_get_sections(self):
+    def test_get_sections(self, users_parser):
         """Test extracting sections from markdown."""
-        parser = MarkdownParser("docs/api/users.md")
-        sections = parser.get_sections()
+        sections = users_parser.get_sections()
         
         assert isinstance(sections, dict)
         assert len(sections) > 0
     
-    def test_contains_text(self):
+    def test_contains_text(self, users_parser):
         """Test checking if documentation contains specific text."""
-        parser = MarkdownParser("docs/api/users.md")
-        
         # Case insensitive search
-        assert parser.contains_text("users")
-        assert parser.contains_text("USERS")
+        assert users_parser.contains_text("users")
+        assert users_parser.contains_text("USERS")
         
         # Case sensitive search
-        assert parser.contains_text("users", case_sensitive=True)
-        assert not parser.contains_text("NONEXISTENT", case_sensitive=True)
+        assert users_parser.contains_text("users", case_sensitive=True)
+        assert not users_parser.contains_text("NONEXISTENT", case_sensitive=True)
     
-    def test_extract_code_references(self):
+    def test_extract_code_references(self, users_parser):
         """Test extracting code references from documentation."""
-        parser = MarkdownParser("docs/api/users.md")
-        references = parser.extract_code_references()
+        references = users_parser.extract_code_references()
         
         assert isinstance(references, list)
         # Should find endpoint references like "GET /users"
@@ -82,81 +102,94 @@ class TestMarkdownParser:
 class TestDocumentationMapper:
     """Tests for DocumentationMapper class."""
     
-    def test_map_handler_to_docs(self):
+    def test_map_handler_to_docs(self, mapper):
         """Test mapping handler files to API documentation."""
-        mapper = DocumentationMapper(".")
-        
         # Map user handler to docs
         doc_files = mapper.map_code_to_docs("backend/handlers/user.py")
         
         # Should map to users.md (pluralized)
         assert any("users.md" in f for f in doc_files)
     
-    def test_map_health_handler_to_docs(self):
+    def test_map_health_handler_to_docs(self, mapper):
         """Test mapping health handler to documentation."""
-        mapper = DocumentationMapper(".")
-        
         doc_files = mapper.map_code_to_docs("backend/handlers/health.py")
         
         # Should map to health.md (not pluralized)
         assert any("health.md" in f for f in doc_files)
     
-    def test_map_main_to_docs(self):
+    def test_map_main_to_docs(self, mapper):
         """Test mapping main.py to architecture docs."""
-        mapper = DocumentationMapper(".")
-        
         doc_files = mapper.map_code_to_docs("backend/main.py")
         
         # Should map to architecture.md
         assert any("architecture.md" in f for f in doc_files)
     
-    def test_map_models_to_docs(self):
+    def test_map_models_to_docs(self, mapper):
         """Test mapping models.py to API docs."""
-        mapper = DocumentationMapper(".")
-        
         doc_files = mapper.map_code_to_docs("backend/models.py")
         
         # Should map to multiple API docs
         assert len(doc_files) > 0
         assert all(f.endswith(".md") for f in doc_files)
     
-    def test_map_endpoint_to_docs(self):
+    def test_map_endpoint_to_docs(self, mapper):
         """Test mapping an endpoint to its documentation."""
-        mapper = DocumentationMapper(".")
-        
         doc_files = mapper.map_endpoint_to_docs("GET", "/users")
         
         # Should find users.md
         assert any("users.md" in f for f in doc_files)
     
-    def test_find_all_doc_files(self):
+    def test_find_all_doc_files(self, mapper):
         """Test finding all documentation files."""
-        mapper = DocumentationMapper(".")
-        
         doc_files = mapper.find_all_doc_files()
         
         assert len(doc_files) > 0
         assert all(f.endswith(".md") for f in doc_files)
         assert any("users.md" in f for f in doc_files)
     
-    def test_get_public_api_files(self):
+    def test_get_public_api_files(self, mapper):
         """Test getting public API documentation files."""
-        mapper = DocumentationMapper(".")
-        
         api_files = mapper.get_public_api_files()
         
         assert len(api_files) > 0
-        # Use Path to handle both Windows and Unix path separators
-        assert all(Path("docs/api") in Path(f).parents or Path(f).parent.name == "api" for f in api_files)
+        # Normalize separators so the check holds on Windows too
+        assert all("docs/api/" in f.replace("\\", "/") for f in api_files)
+    
+    def test_docs_scanned_once_per_mapper(self, tmp_path):
+        """Test that a mapper walks the docs directory only once."""
+        (tmp_path / "docs" / "api").mkdir(parents=True)
+        (tmp_path / "docs" / "index.md").write_text("# Index")
+        (tmp_path / "docs" / "api" / "users.md").write_text("# Users")
+        mapper = DocumentationMapper(str(tmp_path))
+        
+        assert len(mapper.find_all_doc_files()) == 2
+        
+        (tmp_path / "docs" / "api" / "health.md").write_text("# Health")
+        
+        assert len(mapper.find_all_doc_files()) == 2
+        assert mapper.get_public_api_files() == [str(tmp_path / "docs" / "api" / "users.md")]
+        assert len(DocumentationMapper(str(tmp_path)).find_all_doc_files()) == 3
+    
+    def test_docs_scan_skips_symlinked_directories(self, tmp_path):
+        """Test that the docs scan doesn't follow directory symlinks."""
+        (tmp_path / "docs" / "api").mkdir(parents=True)
+        (tmp_path / "docs" / "api" / "users.md").write_text("# Users")
+        try:
+            (tmp_path / "docs" / "api" / "loop").symlink_to(tmp_path / "docs", target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported")
+        
+        doc_files = DocumentationMapper(str(tmp_path)).find_all_doc_files()
+        
+        assert doc_files == [str(f) for f in (tmp_path / "docs").rglob("*.md")]
+        assert len(doc_files) == 1
 
 
 class TestDocumentationAnalyzer:
     """Tests for DocumentationAnalyzer class."""
     
-    def test_analyze_doc_file(self):
+    def test_analyze_doc_file(self, analyzer):
         """Test analyzing a documentation file."""
-        analyzer = DocumentationAnalyzer(".", ".kiro/specs/app.yaml")
-        
         result = analyzer.analyze_doc_file("docs/api/users.md")
         
         assert 'file' in result
@@ -165,10 +198,8 @@ class TestDocumentationAnalyzer:
         assert 'code_references' in result
         assert len(result['api_endpoints']) > 0
     
-    def test_check_endpoint_documented(self):
+    def test_check_endpoint_documented(self, analyzer):
         """Test checking if an endpoint is documented."""
-        analyzer = DocumentationAnalyzer(".", ".kiro/specs/app.yaml")
-        
         # Check existing endpoint
         result = analyzer.check_endpoint_documented("GET", "/users")
         assert result['documented'] is True
@@ -178,24 +209,35 @@ class TestDocumentationAnalyzer:
         result = analyzer.check_endpoint_documented("POST", "/nonexistent")
         assert result['documented'] is False
     
-    def test_check_code_file_documented(self):
+    def test_check_code_file_documented(self, analyzer):
         """Test checking if a code file has documentation."""
-        analyzer = DocumentationAnalyzer(".", ".kiro/specs/app.yaml")
-        
         # Check handler file
         result = analyzer.check_code_file_documented("backend/handlers/user.py")
         assert result['has_docs'] is True
         assert len(result['doc_files']) > 0
     
-    def test_extract_endpoints_from_code(self):
+    def test_extract_endpoints_from_code(self, analyzer):
         """Test extracting endpoints from code file."""
-        analyzer = DocumentationAnalyzer(".", ".kiro/specs/app.yaml")
-        
         endpoints = analyzer.extract_endpoints_from_code("backend/handlers/user.py")
         
         assert len(endpoints) > 0
         assert all('method' in ep and 'path' in ep for ep in endpoints)
 
+    def test_analysis_reused_until_file_changes(self, tmp_path):
+        """Test that cached analysis is dropped once the file changes."""
+        doc = tmp_path / "users.md"
+        doc.write_text("## GET /users\n\nList users.\n")
+        analyzer = DocumentationAnalyzer(str(tmp_path))
+        
+        first = analyzer.analyze_doc_file(str(doc))
+        assert analyzer.analyze_doc_file(str(doc)) is first
+        with pytest.raises(TypeError):
+            first['api_endpoints'][0]['method'] = 'POST'
+        
+        doc.write_text("## GET /users\n\nList users.\n\n## DELETE /users/{id}\n\nDelete a user.\n")
+        
+        assert len(analyzer.analyze_doc_file(str(doc))['api_endpoints']) == 2
+
 
 class TestDocumentationIssue:
     """Tests for DocumentationIssue class."""
@@ -275,44 +317,34 @@ class TestDocumentationReport:
 class TestDocumentationAlignmentDetector:
     """Tests for DocumentationAlignmentDetector class."""
     
-    def test_detect_api_changes_requiring_docs(self):
+    def test_detect_api_changes_requiring_docs(self, detector):
         """Test detecting API changes that need documentation."""
-        detector = DocumentationAlignmentDetector(".", ".kiro/specs/app.yaml")
-        
         # Test with user handler (should have docs)
         issues = detector.detect_api_changes_requiring_docs("backend/handlers/user.py")
         
         # Should not have issues since endpoints are documented
         assert isinstance(issues, list)
     
-    def test_detect_doc_code_mismatches(self):
+    def test_detect_doc_code_mismatches(self, detector):
         """Test detecting mismatches between docs and code."""
-        detector = DocumentationAlignmentDetector(".", ".kiro/specs/app.yaml")
-        
         issues = detector.detect_doc_code_mismatches("backend/handlers/user.py")
         
         assert isinstance(issues, list)
     
-    def test_detect_missing_docs_for_new_features(self):
+    def test_detect_missing_docs_for_new_features(self, detector):
         """Test detecting missing docs for new features."""
-        detector = DocumentationAlignmentDetector(".", ".kiro/specs/app.yaml")
-        
         issues = detector.detect_missing_docs_for_new_features("backend/handlers/user.py")
         
         assert isinstance(issues, list)
     
-    def test_detect_outdated_docs_for_removed_features(self):
+    def test_detect_outdated_docs_for_removed_features(self, detector):
         """Test detecting outdated docs for removed features."""
-        detector = DocumentationAlignmentDetector(".", ".kiro/specs/app.yaml")
-        
         issues = detector.detect_outdated_docs_for_removed_features("backend/handlers/user.py")
         
         assert isinstance(issues, list)
     
-    def test_generate_documentation_report(self):
+    def test_generate_documentation_report(self, detector):
         """Test generating a comprehensive documentation report."""
-        detector = DocumentationAlignmentDetector(".", ".kiro/specs/app.yaml")
-        
         code_files = ["backend/handlers/user.py", "backend/handlers/health.py"]
         report = detector.generate_documentation_report(code_files)
         
@@ -320,10 +352,8 @@ class TestDocumentationAlignmentDetector:
         assert 'files_checked' in report.summary
         assert report.summary['files_checked'] == 2
     
-    def test_validate_staged_changes(self):
+    def test_validate_staged_changes(self, detector):
         """Test validating staged changes for documentation."""
-        detector = DocumentationAlignmentDetector(".", ".kiro/specs/app.yaml")
-        
         staged_files = [
             "backend/handlers/user.py",
             "backend/handlers/health.py",
@@ -336,10 +366,8 @@ class TestDocumentationAlignmentDetector:
         assert 'message' in report.summary
         assert report.summary['files_checked'] == 2  # Only backend files
     
-    def test_validate_staged_changes_no_code_files(self):
+    def test_validate_staged_changes_no_code_files(self, detector):
         """Test validating staged changes with no code files."""
-        detector = DocumentationAlignmentDetector(".", ".kiro/specs/app.yaml")
-        
         staged_files = ["README.md", "docs/index.md"]
         
         report = detector.validate_staged_changes(staged_files)
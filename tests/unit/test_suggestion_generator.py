@@ -0,0 +1,76 @@
+"""Unit tests for suggestion generation functionality."""
+import io
+import json
+
+import pytest
+from backend.suggestion_generator import ComprehensiveSuggestionGenerator
+
+
+@pytest.fixture
+def report():
+    """Build a prioritized report covering spec, test and doc suggestions."""
+    generator = ComprehensiveSuggestionGenerator()
+    return generator.generate_all_suggestions(
+        drift_issues=[
+            {'type': 'drift', 'file': 'backend/handlers/user.py',
+             'description': 'Endpoint GET /users/{id} not defined in spec'}
+        ],
+        test_issues=[
+            {'type': 'missing_tests', 'file': 'backend/handlers/user.py',
+             'description': 'No test file found'}
+        ],
+        doc_issues=[
+            {'type': 'outdated_docs', 'file': 'docs/api/users.md',
+             'description': 'Documents removed endpoint', 'suggestion': 'Remove it'}
+        ]
+    )
+
+
+class TestSuggestionDisplay:
+    """Tests for formatting suggestion reports."""
+
+    def test_format_suggestions_for_display(self, report):
+        """Test formatting a report as text."""
+        generator = ComprehensiveSuggestionGenerator()
+        text = generator.format_suggestions_for_display(report)
+
+        assert text.startswith("=== Suggestion Summary ===\n")
+        assert "Total suggestions: 3" in text
+        assert "1. [SPEC] Priority" in text
+        assert "   File: docs/api/users.md" in text
+        assert text.endswith("\n")
+        assert not text.endswith("\n\n")
+
+    def test_format_empty_report(self):
+        """Test formatting a report with no suggestions."""
+        generator = ComprehensiveSuggestionGenerator()
+        report = generator.generate_all_suggestions()
+        text = generator.format_suggestions_for_display(report)
+
+        assert "Total suggestions: 0" in text
+        assert text.endswith("=== Prioritized Suggestions ===\n")
+
+    def test_write_suggestions_matches_format(self, report):
+        """Test that streaming output matches the formatted string."""
+        generator = ComprehensiveSuggestionGenerator()
+        stream = io.StringIO()
+        generator.write_suggestions(report, stream)
+
+        assert stream.getvalue() == generator.format_suggestions_for_display(report)
+
+
+class TestReportSections:
+    """Tests for the sections of a suggestion report."""
+
+    def test_report_sections(self, report):
+        """Test that the report carries the summary and every detailed section."""
+        assert report['summary']['total_suggestions'] == 3
+        assert len(report['ordered_suggestions']) == 3
+        assert set(report) == {'summary', 'ordered_suggestions', 'categorized', 'groups'}
+
+    def test_report_is_json_serializable(self, report):
+        """Test that the report serializes with every section."""
+        data = json.loads(json.dumps(report))
+
+        assert len(data['ordered_suggestions']) == 3
+        assert len(data['groups']) == 3
@@ -1,11 +1,27 @@
 """
 Unit tests for the validation orchestrator module.
 """
+import threading
 import pytest
+from concurrent.futures import CancelledError
 from pathlib import Path
 from backend.validator import ValidationOrchestrator, ValidationResult, SteeringRulesParser
 
 
+@pytest.fixture(scope="module")
+def models_validation():
+    """Run the full validation pipeline on backend/models.py once for the whole module."""
+    orchestrator = ValidationOrchestrator()
+    
+    git_context = {
+        'branch': 'main',
+        'stagedFiles': ['backend/models.py'],
+        'diff': ''
+    }
+    
+    return orchestrator.validate(git_context)
+
+
 class TestSteeringRulesParser:
     """Tests for the steering rules parser."""
     
@@ -37,6 +53,39 @@ class TestSteeringRulesParser:
         
         # Should include common patterns like __pycache__
         assert any('__pycache__' in pattern for pattern in rules['ignore_patterns'])
+    
+    def test_parsed_rules_are_read_only(self):
+        """Test that parsed rules can't be mutated by consumers."""
+        rules = SteeringRulesParser().parse()
+        
+        with pytest.raises(TypeError):
+            rules['ignore_patterns'] = []
+        with pytest.raises(TypeError):
+            rules['validation_priorities']['Documentation'] = 0
+        assert isinstance(rules['ignore_patterns'], tuple)
+    
+    def test_parse_shared_across_parsers_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that a second parser reuses the parse of an unchanged file."""
+        import os
+        
+        rules_path = tmp_path / "rules.md"
+        rules_path.write_text("## Rules\n\n- `backend/a.py` → `tests/unit/test_a.py`\n", encoding='utf-8')
+        first = SteeringRulesParser(str(rules_path)).parse()
+        
+        def fail_read(*args, **kwargs):
+            raise AssertionError("rules file re-read")
+        
+        monkeypatch.setattr(Path, 'read_text', fail_read)
+        second = SteeringRulesParser(str(rules_path)).parse()
+        assert second == first
+        monkeypatch.undo()
+        
+        # A modified file is parsed again
+        rules_path.write_text("## Rules\n\n- `backend/b.py` → `tests/unit/test_b.py`\n", encoding='utf-8')
+        stat = rules_path.stat()
+        os.utime(rules_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        third = SteeringRulesParser(str(rules_path)).parse()
+        assert list(third['correlation_patterns']) == ['backend/b.py']
 
 
 class TestValidationOrchestrator:
@@ -93,20 +142,9 @@ class TestValidationOrchestrator:
         assert result is not None
         assert result['success'] is True  # All files ignored
     
-    def test_validate_with_backend_files(self):
+    def test_validate_with_backend_files(self, models_validation):
         """Test validation with backend Python files."""
-        orchestrator = ValidationOrchestrator()
-        
-        # Use actual files that exist
-        git_context = {
-            'branch': 'main',
-            'stagedFiles': [
-                'backend/models.py'
-            ],
-            'diff': ''
-        }
-        
-        result = orchestrator.validate(git_context)
+        result = models_validation
         
         assert result is not None
         assert 'success' in result
@@ -116,6 +154,70 @@ class TestValidationOrchestrator:
         assert 'test_report' in result
         assert 'doc_report' in result
     
+    def test_validation_config_cached_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that specsync.json is only re-parsed when it changes."""
+        import json
+        import os
+        
+        config_path = tmp_path / ".kiro/settings/specsync.json"
+        config_path.parent.mkdir(parents=True)
+        config_path.write_text(json.dumps({'validation': {'check_documentation': False}}))
+        monkeypatch.chdir(tmp_path)
+        
+        orchestrator = ValidationOrchestrator()
+        first = orchestrator._load_validation_config()
+        assert first['check_documentation'] is False
+        assert orchestrator._load_validation_config() is first
+        
+        # Rewrite with a new mtime so the cache is invalidated
+        config_path.write_text(json.dumps({'validation': {'check_documentation': True}}))
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert orchestrator._load_validation_config()['check_documentation'] is True
+    
+    def test_steering_rules_recheck_is_throttled(self, tmp_path):
+        """Test that back-to-back reload checks skip the mtime lookup."""
+        import os
+        
+        rules_path = tmp_path / "rules.md"
+        rules_path.write_text(Path(".kiro/steering/rules.md").read_text(encoding='utf-8'))
+        
+        orchestrator = ValidationOrchestrator(steering_rules_path=str(rules_path))
+        assert orchestrator.check_and_reload_steering_rules() is True
+        
+        stat = rules_path.stat()
+        os.utime(rules_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert orchestrator.check_and_reload_steering_rules() is False
+        
+        # Once the recheck interval has passed the change is picked up
+        orchestrator._last_mtime_check = None
+        assert orchestrator.check_and_reload_steering_rules() is True
+    
+    def test_get_orchestrator_shared_per_directory(self, tmp_path, monkeypatch):
+        """Test that the orchestrator factory reuses instances per directory."""
+        from backend.validator import get_orchestrator
+        
+        orchestrator = get_orchestrator()
+        assert isinstance(orchestrator, ValidationOrchestrator)
+        assert get_orchestrator() is orchestrator
+        assert get_orchestrator(timeout_seconds=5) is not orchestrator
+        
+        monkeypatch.chdir(tmp_path)
+        assert get_orchestrator() is not orchestrator
+    
+    def test_analyzers_skipped_without_python_files(self):
+        """Test that test and doc analyzers are skipped for non-code changes."""
+        orchestrator = ValidationOrchestrator()
+        files = ['README.md', 'docs/index.md']
+        
+        test_report = orchestrator._run_test_coverage_validation(files, '.kiro/specs/app.yaml')
+        doc_report = orchestrator._run_documentation_validation(files, '.kiro/specs/app.yaml')
+        
+        assert test_report['skipped'] is True
+        assert test_report['has_issues'] is False
+        assert doc_report['skipped'] is True
+        assert doc_report['summary']['files_checked'] == 0
+    
     def test_apply_steering_rules(self):
         """Test applying steering rules to validation context."""
         orchestrator = ValidationOrchestrator()
@@ -150,6 +252,49 @@ class TestValidationOrchestrator:
         
         # Test no match
         assert not orchestrator.rule_engine._matches_pattern('frontend/app.js', 'backend/*.py')
+    
+    def test_filter_ignored_files_matches_per_pattern_check(self):
+        """Test that the combined ignore regex agrees with matching each pattern."""
+        orchestrator = ValidationOrchestrator()
+        orchestrator.load_steering_rules()
+        engine = orchestrator.rule_engine
+        
+        files = [
+            '__pycache__/test.pyc',
+            'backend/__pycache__/models.pyc',
+            'node_modules/package.json',
+            'backend/models.py',
+            'docs/index.md'
+        ]
+        expected = [
+            file_path for file_path in files
+            if not any(engine._matches_pattern(file_path, p) for p in engine.ignore_patterns)
+        ]
+        
+        assert engine.filter_ignored_files(files) == expected
+        assert 'backend/models.py' in expected
+        
+        kept, ignored = engine.partition_files(files)
+        assert kept == expected
+        assert ignored == [file_path for file_path in files if file_path not in expected]
+    
+    def test_expand_pattern(self):
+        """Test substituting captured variables into target patterns."""
+        orchestrator = ValidationOrchestrator()
+        orchestrator.load_steering_rules()
+        engine = orchestrator.rule_engine
+        
+        assert engine._expand_pattern(
+            'backend/handlers/user.py', 'backend/handlers/{module}.py', 'tests/unit/test_{module}.py'
+        ) == 'tests/unit/test_user.py'
+        
+        # Unknown placeholders are left as written
+        assert engine._expand_pattern(
+            'backend/handlers/user.py', 'backend/handlers/{module}.py', 'docs/{section}/{module}.md'
+        ) == 'docs/{section}/user.md'
+        
+        mappings = engine.apply_correlation_patterns(['backend/handlers/user.py'])
+        assert 'tests/unit/test_user.py' in mappings['backend/handlers/user.py']
 
 
 class TestValidationResult:
@@ -285,6 +430,52 @@ class TestStagedChangesPreservation:
         state2 = get_staging_area_state()
         assert state == state2
     
+    def test_staging_area_state_when_git_hangs(self, monkeypatch):
+        """Test that a git call exceeding its timeout yields an empty state."""
+        import subprocess
+        import backend.validator as validator
+        
+        def hang(args, **kwargs):
+            raise subprocess.TimeoutExpired(args, kwargs.get('timeout'))
+        
+        monkeypatch.setattr(validator, 'pygit2', None)
+        monkeypatch.setattr(validator.subprocess, 'run', hang)
+        
+        assert validator.get_staging_area_state() == ""
+    
+    def test_pygit2_index_state_honours_git_index_file(self, tmp_path, monkeypatch):
+        """Test that the pygit2 index hash reads the index named by GIT_INDEX_FILE."""
+        pytest.importorskip("pygit2")
+        from backend.validator import _get_index_state_pygit2
+        
+        repository_state = _get_index_state_pygit2()
+        
+        # A missing index file reads as an empty index
+        monkeypatch.setenv('GIT_INDEX_FILE', str(tmp_path / 'index'))
+        assert _get_index_state_pygit2() != repository_state
+    
+    def test_staging_area_state_after_reuses_state_when_index_unchanged(self):
+        """Test that an unchanged index fingerprint reuses the captured state."""
+        from backend.validator import (
+            get_staging_area_fingerprint, get_staging_area_state_after
+        )
+        
+        fingerprint = get_staging_area_fingerprint()
+        assert fingerprint == get_staging_area_fingerprint()
+        
+        if fingerprint is not None:
+            # Index untouched, so the cached state is returned as-is
+            assert get_staging_area_state_after("cached", fingerprint) == "cached"
+    
+    def test_staging_state_reused_across_validations(self):
+        """Test that the orchestrator reuses the state while the index is unchanged."""
+        orchestrator = ValidationOrchestrator()
+        state, fingerprint = orchestrator._capture_staging_state()
+        
+        if fingerprint is not None:
+            orchestrator._staging_state_cache = (fingerprint, "cached")
+            assert orchestrator._capture_staging_state() == ("cached", fingerprint)
+    
     def test_verify_staging_area_unchanged_success(self):
         """Test verification passes when staging area is unchanged."""
         from backend.validator import verify_staging_area_unchanged
@@ -365,17 +556,9 @@ class TestStagedChangesPreservation:
         assert "CRITICAL" in display
         assert "Staging area was modified" in display
     
-    def test_validation_with_backend_files_preserves_staging(self):
+    def test_validation_with_backend_files_preserves_staging(self, models_validation):
         """Test that validation with actual files preserves staging area."""
-        orchestrator = ValidationOrchestrator()
-        
-        git_context = {
-            'branch': 'main',
-            'stagedFiles': ['backend/models.py'],
-            'diff': ''
-        }
-        
-        result = orchestrator.validate(git_context)
+        result = models_validation
         
         # Validation should complete without modifying staging area
         assert result['staging_area_preserved'] is True
@@ -407,17 +590,9 @@ class TestPerformanceMonitoring:
         assert result['timing']['total'] > 0
         assert result['timed_out'] is False
     
-    def test_timing_data_structure(self):
+    def test_timing_data_structure(self, models_validation):
         """Test that timing data has expected structure."""
-        orchestrator = ValidationOrchestrator()
-        
-        git_context = {
-            'branch': 'main',
-            'stagedFiles': ['backend/models.py'],
-            'diff': ''
-        }
-        
-        result = orchestrator.validate(git_context)
+        result = models_validation
         
         timing = result['timing']
         assert 'context_initialization' in timing
@@ -431,6 +606,52 @@ class TestPerformanceMonitoring:
         # All timing values should be non-negative
         for key, value in timing.items():
             assert value >= 0
+        
+        # Exact nanosecond durations mirror the seconds breakdown
+        timing_ns = result['timing_ns']
+        assert set(timing_ns) == set(timing)
+        assert all(isinstance(value, int) for value in timing_ns.values())
+        assert timing['total'] == timing_ns['total'] / 1e9
+    
+    def test_timeout_returns_partial_results(self, monkeypatch):
+        """Test that a slow step times out while completed steps are kept."""
+        import time
+        
+        orchestrator = ValidationOrchestrator(timeout_seconds=1)
+        stopped = threading.Event()
+        
+        def slow_drift_detection(files, spec_path):
+            # Hold the step until the orchestrator gives up on it, then run the
+            # real drift detection, which should stop before its first file
+            orchestrator._cancel_event.wait(3)
+            try:
+                ValidationOrchestrator._run_drift_detection(orchestrator, files, spec_path)
+            except CancelledError:
+                stopped.set()
+        
+        monkeypatch.setattr(orchestrator, '_run_drift_detection', slow_drift_detection)
+        monkeypatch.setattr(orchestrator, '_run_test_coverage_validation',
+                            lambda files, spec_path: {'has_issues': False, 'issues': []})
+        
+        git_context = {
+            'branch': 'main',
+            'stagedFiles': ['backend/models.py'],
+            'diff': ''
+        }
+        
+        start = time.time()
+        result = orchestrator.validate(git_context)
+        
+        assert time.time() - start < 3
+        assert result['timed_out'] is True
+        assert result['partial_results'] is True
+        assert result['allowCommit'] is False
+        assert result['drift_report'] is None
+        assert result['test_report'] == {'has_issues': False, 'issues': []}
+        
+        # Steps still running were asked to stop, and did
+        assert orchestrator._cancel_event.is_set()
+        assert stopped.wait(3)
     
     def test_get_timing_summary(self):
         """Test getting timing summary."""